@@ -6,6 +6,7 @@ Handles SQLite database operations for tickets and session information
 
 import aiosqlite
 import json
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -14,11 +15,54 @@ from modules.config import DEFAULT_CODEBASE_PATH
 
 DATABASE_PATH = Path(__file__).parent / "sdlc.db"
 
+# Per-stage counters returned to the frontend after each agent message
+MESSAGE_COUNT_COLUMNS = """
+    total_plan_messages,
+    total_build_messages,
+    total_review_messages,
+    total_plan_tool_calls,
+    total_build_tool_calls,
+    total_review_tool_calls
+"""
+
+# One statement for every stage and message type: the stage and tool_use flag
+# are bound parameters (SQLite comparisons yield 0/1) rather than column
+# names spliced into the SQL, so the text never varies between calls
+APPEND_AGENT_MESSAGE_SQL = f"""
+    UPDATE tickets
+    SET agent_messages = json_insert(agent_messages, '$[#]', json(:message)),
+        total_plan_messages = total_plan_messages + (:stage = 'plan'),
+        total_build_messages = total_build_messages + (:stage = 'build'),
+        total_review_messages = total_review_messages + (:stage = 'review'),
+        total_plan_tool_calls = total_plan_tool_calls + (:stage = 'plan' AND :is_tool_use),
+        total_build_tool_calls = total_build_tool_calls + (:stage = 'build' AND :is_tool_use),
+        total_review_tool_calls = total_review_tool_calls + (:stage = 'review' AND :is_tool_use),
+        updated_at = :updated_at
+    WHERE id = :ticket_id
+    RETURNING {MESSAGE_COUNT_COLUMNS}
+"""
+
+
+@asynccontextmanager
+async def connect():
+    """Open a connection tuned for many small commits
+
+    The database runs in WAL mode (set once by init_database), where
+    synchronous=NORMAL skips the fsync on every commit and stays corruption-safe.
+    Concurrent workflows wait up to 30s for the write lock instead of failing.
+    """
+    async with aiosqlite.connect(DATABASE_PATH, timeout=30) as db:
+        await db.execute("PRAGMA synchronous=NORMAL")
+        yield db
+
 
 async def init_database():
     """Initialize the database with required tables"""
 
-    async with aiosqlite.connect(DATABASE_PATH) as db:
+    async with connect() as db:
+        # WAL is persistent, so setting it here covers every later connection
+        await db.execute("PRAGMA journal_mode=WAL")
+
         # Create tickets table
         await db.execute("""
             CREATE TABLE IF NOT EXISTS tickets (
@@ -52,6 +96,13 @@ async def init_database():
             )
         """)
 
+        # get_all_tickets orders the board newest-first; let SQLite walk
+        # this index instead of sorting the whole table on every listing
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tickets_created_at
+            ON tickets (created_at DESC)
+        """)
+
         # Create session_information table
         await db.execute("""
             CREATE TABLE IF NOT EXISTS session_information (
@@ -79,8 +130,8 @@ async def create_ticket(
     content_user_request_prompt: str,
     model: str = "claude-sonnet-4-20250514",
     parent_codebase_path: str = None
-) -> int:
-    """Create a new ticket"""
+) -> Dict[str, Any]:
+    """Create a new ticket and return it, column defaults included"""
 
     # Use default codebase path if not specified
     if parent_codebase_path is None:
@@ -88,7 +139,10 @@ async def create_ticket(
 
     now = datetime.now().isoformat()
 
-    async with aiosqlite.connect(DATABASE_PATH) as db:
+    async with connect() as db:
+        db.row_factory = aiosqlite.Row
+        # RETURNING hands back the stored row, so callers don't need a
+        # second connection and SELECT to read what was just inserted
         cursor = await db.execute("""
             INSERT INTO tickets (
                 title,
@@ -99,16 +153,21 @@ async def create_ticket(
                 updated_at
             )
             VALUES (?, ?, ?, ?, ?, ?)
+            RETURNING *
         """, (title, content_user_request_prompt, model, parent_codebase_path, now, now))
 
+        ticket = dict(await cursor.fetchone())
         await db.commit()
-        return cursor.lastrowid
+
+    # Parse JSON fields
+    ticket['agent_messages'] = json.loads(ticket['agent_messages'])
+    return ticket
 
 
 async def get_ticket(ticket_id: int) -> Optional[Dict[str, Any]]:
     """Get a ticket by ID"""
 
-    async with aiosqlite.connect(DATABASE_PATH) as db:
+    async with connect() as db:
         db.row_factory = aiosqlite.Row
         cursor = await db.execute("SELECT * FROM tickets WHERE id = ?", (ticket_id,))
         row = await cursor.fetchone()
@@ -125,7 +184,7 @@ async def get_ticket(ticket_id: int) -> Optional[Dict[str, Any]]:
 async def get_all_tickets() -> List[Dict[str, Any]]:
     """Get all tickets"""
 
-    async with aiosqlite.connect(DATABASE_PATH) as db:
+    async with connect() as db:
         db.row_factory = aiosqlite.Row
         cursor = await db.execute("SELECT * FROM tickets ORDER BY created_at DESC")
         rows = await cursor.fetchall()
@@ -145,7 +204,7 @@ async def update_ticket_stage(ticket_id: int, stage: str) -> None:
 
     now = datetime.now().isoformat()
 
-    async with aiosqlite.connect(DATABASE_PATH) as db:
+    async with connect() as db:
         await db.execute("""
             UPDATE tickets
             SET stage = ?, updated_at = ?
@@ -165,7 +224,7 @@ async def update_ticket_plan(
 
     now = datetime.now().isoformat()
 
-    async with aiosqlite.connect(DATABASE_PATH) as db:
+    async with connect() as db:
         await db.execute("""
             UPDATE tickets
             SET plan_path = ?,
@@ -187,7 +246,7 @@ async def update_ticket_build(
 
     now = datetime.now().isoformat()
 
-    async with aiosqlite.connect(DATABASE_PATH) as db:
+    async with connect() as db:
         await db.execute("""
             UPDATE tickets
             SET content_build_response = ?,
@@ -208,7 +267,7 @@ async def update_ticket_review(
 
     now = datetime.now().isoformat()
 
-    async with aiosqlite.connect(DATABASE_PATH) as db:
+    async with connect() as db:
         await db.execute("""
             UPDATE tickets
             SET content_review_response = ?,
@@ -229,63 +288,26 @@ async def append_agent_message(
     Returns the updated counts for real-time updates
     """
 
-    async with aiosqlite.connect(DATABASE_PATH) as db:
+    async with connect() as db:
         db.row_factory = aiosqlite.Row
 
-        # Get current messages
-        cursor = await db.execute("SELECT agent_messages FROM tickets WHERE id = ?", (ticket_id,))
-        row = await cursor.fetchone()
+        # Append in SQL with json_insert instead of loading, parsing and
+        # re-encoding the whole message history on every streamed message,
+        # and read the updated counts back with RETURNING in the same trip
+        cursor = await db.execute(APPEND_AGENT_MESSAGE_SQL, {
+            "message": json.dumps(message),
+            "stage": stage,
+            "is_tool_use": message.get('type') == 'tool_use',
+            "updated_at": datetime.now().isoformat(),
+            "ticket_id": ticket_id,
+        })
+
+        # Fetch before committing; the RETURNING rows belong to the statement
+        counts_row = await cursor.fetchone()
+        await db.commit()
 
-        if row:
-            messages = json.loads(row[0])
-            messages.append(message)
-
-            # Update messages and increment counter for the stage
-            counter_field = f"total_{stage}_messages"
-            if message.get('type') == 'tool_use':
-                tool_counter = f"total_{stage}_tool_calls"
-                await db.execute(f"""
-                    UPDATE tickets
-                    SET agent_messages = ?,
-                        {counter_field} = {counter_field} + 1,
-                        {tool_counter} = {tool_counter} + 1,
-                        updated_at = ?
-                    WHERE id = ?
-                """, (json.dumps(messages), datetime.now().isoformat(), ticket_id))
-            else:
-                await db.execute(f"""
-                    UPDATE tickets
-                    SET agent_messages = ?,
-                        {counter_field} = {counter_field} + 1,
-                        updated_at = ?
-                    WHERE id = ?
-                """, (json.dumps(messages), datetime.now().isoformat(), ticket_id))
-
-            await db.commit()
-
-            # Get updated counts to return
-            cursor = await db.execute(f"""
-                SELECT
-                    total_plan_messages,
-                    total_build_messages,
-                    total_review_messages,
-                    total_plan_tool_calls,
-                    total_build_tool_calls,
-                    total_review_tool_calls
-                FROM tickets
-                WHERE id = ?
-            """, (ticket_id,))
-
-            counts_row = await cursor.fetchone()
-            if counts_row:
-                return {
-                    'total_plan_messages': counts_row['total_plan_messages'],
-                    'total_build_messages': counts_row['total_build_messages'],
-                    'total_review_messages': counts_row['total_review_messages'],
-                    'total_plan_tool_calls': counts_row['total_plan_tool_calls'],
-                    'total_build_tool_calls': counts_row['total_build_tool_calls'],
-                    'total_review_tool_calls': counts_row['total_review_tool_calls']
-                }
+        if counts_row:
+            return dict(counts_row)
 
     return {}
 
@@ -293,7 +315,7 @@ async def append_agent_message(
 async def get_session_info() -> Dict[str, Any]:
     """Get session information"""
 
-    async with aiosqlite.connect(DATABASE_PATH) as db:
+    async with connect() as db:
         db.row_factory = aiosqlite.Row
         cursor = await db.execute("SELECT * FROM session_information LIMIT 1")
         row = await cursor.fetchone()
@@ -6,8 +6,9 @@ FastAPI server for managing plan, build, and review workflow
 
 import asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import BackgroundTasks, FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 from pathlib import Path
@@ -17,7 +18,12 @@ import time
 from rich.console import Console
 
 # Import configuration
-from modules.config import DEFAULT_CODEBASE_PATH, PLAN_DIRECTORY, REVIEW_DIRECTORY
+from modules.config import (
+    DEFAULT_CODEBASE_PATH,
+    PLAN_DIRECTORY,
+    REVIEW_DIRECTORY,
+    VERBOSE_WEBSOCKET_LOGGING,
+)
 from rich.panel import Panel
 from rich.table import Table
 
@@ -107,12 +113,17 @@ class ConnectionManager:
 
     async def send_json(self, data: dict):
         """Send JSON data to all connected clients"""
-        console.print(
-            f"[cyan]📤 Sending WebSocket message to {len(self.active_connections)} clients: {data.get('type', 'unknown')}[/cyan]"
-        )
-        for connection in self.active_connections:
+        if VERBOSE_WEBSOCKET_LOGGING:
+            console.print(
+                f"[cyan]📤 Sending WebSocket message to {len(self.active_connections)} clients: {data.get('type', 'unknown')}[/cyan]"
+            )
+        # Encode once for all clients; WebSocket.send_json would re-encode the
+        # same payload per connection. Same encoding Starlette uses
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        # Snapshot the list: a client can disconnect while a send is awaited
+        for connection in tuple(self.active_connections):
             try:
-                await connection.send_json(data)
+                await connection.send_text(text)
             except Exception as e:
                 # Connection might be closed
                 console.print(f"[red]❌ Failed to send to client: {e}[/red]")
@@ -161,6 +172,11 @@ class WorkflowTracker:
 # Initialize tracker
 workflow_tracker = WorkflowTracker()
 
+# Running workflow tasks. Holding them here keeps them from being garbage
+# collected mid-run and avoids scanning asyncio.all_tasks() to count them;
+# each task removes itself when it finishes.
+workflow_tasks: set[asyncio.Task] = set()
+
 
 # Pydantic models
 class CreateTicketRequest(BaseModel):
@@ -197,31 +213,32 @@ async def get_workflow_status():
             "name": t.get_name(),
             "done": t.done(),
         }
-        for t in asyncio.all_tasks()
-        if t.get_name().startswith("workflow_")
+        for t in workflow_tasks
     ]
 
     return {"running_count": len(running_tasks), "workflows": running_tasks}
 
 
 @app.post("/tickets")
-async def create_new_ticket(request: CreateTicketRequest):
+async def create_new_ticket(request: CreateTicketRequest, background_tasks: BackgroundTasks):
     """Create a new ticket"""
 
     console.print(f"[blue]📝 Creating new ticket: {request.title}[/blue]")
 
-    ticket_id = await create_ticket(
+    ticket = await create_ticket(
         title=request.title,
         content_user_request_prompt=request.content_user_request_prompt,
         model=request.model,
         parent_codebase_path=request.parent_codebase_path,
     )
 
-    ticket = await get_ticket(ticket_id)
-    console.print(f"[green]✅ Ticket created with ID: {ticket_id}[/green]")
+    console.print(f"[green]✅ Ticket created with ID: {ticket['id']}[/green]")
 
-    # Send update to all connected clients
-    await manager.send_json({"type": "ticket_created", "ticket": ticket})
+    # Notify connected clients after the response is sent, so the creating
+    # client isn't kept waiting on the broadcast
+    background_tasks.add_task(
+        manager.send_json, {"type": "ticket_created", "ticket": ticket}
+    )
 
     return ticket
 
@@ -229,7 +246,10 @@ async def create_new_ticket(request: CreateTicketRequest):
 @app.get("/tickets")
 async def list_tickets():
     """Get all tickets"""
-    return await get_all_tickets()
+    # Tickets are plain JSON-ready dicts straight from SQLite. Returning a
+    # JSONResponse skips jsonable_encoder's recursive walk over every
+    # ticket's agent_messages history
+    return JSONResponse(await get_all_tickets())
 
 
 @app.get("/tickets/{ticket_id}")
@@ -240,11 +260,13 @@ async def get_ticket_by_id(ticket_id: int):
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
-    return ticket
+    return JSONResponse(ticket)
 
 
 @app.put("/tickets/{ticket_id}/stage")
-async def update_stage(ticket_id: int, request: UpdateTicketStageRequest):
+async def update_stage(
+    ticket_id: int, request: UpdateTicketStageRequest, background_tasks: BackgroundTasks
+):
     """Update ticket stage and trigger appropriate agent"""
 
     ticket = await get_ticket(ticket_id)
@@ -283,23 +305,23 @@ async def update_stage(ticket_id: int, request: UpdateTicketStageRequest):
         # Create task with a name for tracking concurrent executions
         task = asyncio.create_task(run_workflow(ticket_id))
         task.set_name(f"workflow_{ticket_id}")
+        workflow_tasks.add(task)
+        task.add_done_callback(workflow_tasks.discard)
 
         console.print(f"[cyan]🚀 Started workflow task for ticket #{ticket_id}[/cyan]")
 
         # Log all currently running workflows
-        all_tasks = [
-            t for t in asyncio.all_tasks() if t.get_name().startswith("workflow_")
-        ]
-        console.print(f"[dim]📊 Currently running workflows: {len(all_tasks)}[/dim]")
+        console.print(f"[dim]📊 Currently running workflows: {len(workflow_tasks)}[/dim]")
 
-    # Send update to all connected clients
-    await manager.send_json(
+    # Notify connected clients after the response is sent
+    background_tasks.add_task(
+        manager.send_json,
         {
             "type": "stage_updated",
             "ticket_id": ticket_id,
             "old_stage": old_stage,
             "new_stage": new_stage,
-        }
+        },
     )
 
     return {"status": "success", "new_stage": new_stage}
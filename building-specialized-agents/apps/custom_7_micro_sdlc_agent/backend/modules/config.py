@@ -4,6 +4,7 @@ Configuration module for Micro SDLC Agent
 Central location for application-wide settings and constants
 """
 
+import os
 from pathlib import Path
 
 # ============================================================================
@@ -50,4 +51,12 @@ AVAILABLE_MODELS = [
 # ============================================================================
 
 # Database file location
-DATABASE_NAME = "sdlc.db"
\ No newline at end of file
+DATABASE_NAME = "sdlc.db"
+
+# ============================================================================
+# LOGGING CONFIGURATION
+# ============================================================================
+
+# Log every outgoing WebSocket broadcast. Agents stream a message per tool
+# call, so this is off unless SDLC_VERBOSE_WS_LOGS is set to 1/true
+VERBOSE_WEBSOCKET_LOGGING = os.getenv("SDLC_VERBOSE_WS_LOGS", "").lower() in ("1", "true")
@@ -766,7 +766,8 @@ async def broadcast_message(message: Dict[str, Any]):
     """Broadcast message to all connected WebSocket clients"""
 
     disconnected = []
-    for connection in active_connections:
+    # Snapshot the list: a client can disconnect while a send is awaited
+    for connection in tuple(active_connections):
         try:
             await connection.send_json(message)
         except:
@@ -974,8 +975,22 @@ async def run_stream_agent():
 
     global stream_agent_client, current_line_index, lines_processed_in_session
 
+    # File size and line index at the last query; if neither has moved the
+    # agent already has nothing to do, so skip the round trip
+    last_query_state = None
+
     while stream_agent_client:
         try:
+            try:
+                file_size = Path(jsonl_file_path).stat().st_size
+            except OSError:
+                file_size = -1
+            query_state = (file_size, current_line_index)
+            if query_state == last_query_state:
+                await asyncio.sleep(0.5)
+                continue
+            last_query_state = query_state
+
             # Send current line index to agent
             await stream_agent_client.query(str(current_line_index))
 
@@ -1024,6 +1039,7 @@ async def run_stream_agent():
             console.print(
                 Panel(f"Stream agent error: {e}", title="run_stream_agent", style="red")
             )
+            last_query_state = None  # Retry even if the file hasn't changed
             await asyncio.sleep(5)  # Wait before retry
 
 
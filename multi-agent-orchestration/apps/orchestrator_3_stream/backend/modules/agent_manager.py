@@ -869,8 +869,7 @@ class AgentManager:
                     self.active_clients.pop(agent.name, None)
 
             # Update session and status
-            await update_agent_session(agent_id, session_id)
-            await update_agent_status(agent_id, "idle")
+            await update_agent_session(agent_id, session_id, status="idle")
             await self.ws_manager.broadcast_agent_status_change(
                 str(agent_id), "executing", "idle"
             )
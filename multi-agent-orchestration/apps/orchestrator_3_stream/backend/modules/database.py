@@ -157,14 +157,15 @@ async def get_or_create_orchestrator(
                 result["metadata"] = json.loads(result["metadata"])
             return result
 
-        # Create new orchestrator
+        # Create new orchestrator and return it in the same round trip
         orch_id = uuid.uuid4()
-        await conn.execute(
+        row = await conn.fetchrow(
             """
             INSERT INTO orchestrator_agents (
                 id, system_prompt, status, working_dir,
                 metadata, created_at, updated_at
             ) VALUES ($1, $2, $3, $4, $5::jsonb, NOW(), NOW())
+            RETURNING *
         """,
             orch_id,
             system_prompt,
@@ -172,11 +173,6 @@ async def get_or_create_orchestrator(
             working_dir,
             json.dumps({}),
         )
-
-        # Fetch and return the created orchestrator
-        row = await conn.fetchrow(
-            "SELECT * FROM orchestrator_agents WHERE id = $1", orch_id
-        )
         result = dict(row)
         if isinstance(result.get("metadata"), str):
             result["metadata"] = json.loads(result["metadata"])
@@ -210,12 +206,14 @@ async def create_new_orchestrator(
         orch_id = uuid.uuid4()
 
         # Create new orchestrator with NULL session_id (will be populated after first interaction)
-        await conn.execute(
+        # and return the created row in the same round trip
+        row = await conn.fetchrow(
             """
             INSERT INTO orchestrator_agents (
                 id, session_id, system_prompt, status, working_dir,
                 metadata, created_at, updated_at
             ) VALUES ($1, $2, $3, $4, $5, $6::jsonb, NOW(), NOW())
+            RETURNING *
         """,
             orch_id,
             None,  # session_id starts as NULL, will be set by Claude SDK
@@ -224,11 +222,6 @@ async def create_new_orchestrator(
             working_dir,
             json.dumps({}),
         )
-
-        # Fetch and return the created orchestrator
-        row = await conn.fetchrow(
-            "SELECT * FROM orchestrator_agents WHERE id = $1", orch_id
-        )
         result = dict(row)
         if isinstance(result.get("metadata"), str):
             result["metadata"] = json.loads(result["metadata"])
@@ -406,8 +399,9 @@ async def update_orchestrator_costs(
         ... )
     """
     async with get_connection() as conn:
-        # Execute the UPDATE - with ID matching to only update THIS orchestrator
-        result = await conn.execute(
+        # Execute the UPDATE - with ID matching to only update THIS orchestrator.
+        # RETURNING hands back the new totals without a second SELECT.
+        row = await conn.fetchrow(
             """
             UPDATE orchestrator_agents
             SET input_tokens = input_tokens + $1,
@@ -415,6 +409,7 @@ async def update_orchestrator_costs(
                 total_cost = total_cost + $3,
                 updated_at = NOW()
             WHERE id = $4 AND archived = false
+            RETURNING id, input_tokens, output_tokens, total_cost, updated_at
         """,
             input_tokens,
             output_tokens,
@@ -422,20 +417,10 @@ async def update_orchestrator_costs(
             orchestrator_agent_id,
         )
 
-        # Get updated row to verify
-        row = await conn.fetchrow(
-            """
-            SELECT id, input_tokens, output_tokens, total_cost, updated_at
-            FROM orchestrator_agents
-            WHERE id = $1 AND archived = false
-            """,
-            orchestrator_agent_id,
-        )
-
         if row:
             return {
                 "success": True,
-                "rows_updated": int(result.split()[-1]) if result else 0,
+                "rows_updated": 1,
                 "id": str(row["id"]),
                 "input_tokens": row["input_tokens"],
                 "output_tokens": row["output_tokens"],
@@ -873,19 +858,28 @@ async def update_agent_status(agent_id: uuid.UUID, status: str) -> None:
         )
 
 
-async def update_agent_session(agent_id: uuid.UUID, session_id: Optional[str]) -> None:
+async def update_agent_session(
+    agent_id: uuid.UUID, session_id: Optional[str], status: Optional[str] = None
+) -> None:
     """
     Update agent's Claude SDK session ID.
 
     Args:
         agent_id: UUID of the agent
         session_id: Claude SDK session ID or None to clear
+        status: Optional new status, written in the same UPDATE so finishing a
+            command costs one round trip instead of two
     """
     async with get_connection() as conn:
         await conn.execute(
-            "UPDATE agents SET session_id = $1, updated_at = NOW() WHERE id = $2",
+            """
+            UPDATE agents
+            SET session_id = $1, status = COALESCE($3, status), updated_at = NOW()
+            WHERE id = $2
+        """,
             session_id,
             agent_id,
+            status,
         )
 
 
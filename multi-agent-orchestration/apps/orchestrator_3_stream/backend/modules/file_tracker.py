@@ -73,8 +73,9 @@ class FileTracker:
         self.modified_files: Set[str] = set()
         self.read_files: Set[str] = set()
 
-        # Store detailed info for modified files
-        self._file_details: Dict[str, Dict[str, Any]] = {}
+        # Tool that first modified each file. Only the name is kept; the
+        # tool input (e.g. a Write's full file content) isn't needed later.
+        self._modifying_tools: Dict[str, str] = {}
 
     def track_modified_file(self, tool_name: str, tool_input: Dict[str, Any]) -> None:
         """
@@ -93,12 +94,8 @@ class FileTracker:
         # Add to modified files set
         self.modified_files.add(file_path)
 
-        # Store tool info for later summary generation
-        if file_path not in self._file_details:
-            self._file_details[file_path] = {
-                "tool_name": tool_name,
-                "tool_input": tool_input
-            }
+        # Store tool name for later summary generation
+        self._modifying_tools.setdefault(file_path, tool_name)
 
     def track_read_file(self, file_path: str) -> None:
         """
@@ -130,8 +127,7 @@ class FileTracker:
         for file_path in self.modified_files:
             try:
                 # Get tool info
-                tool_info = self._file_details.get(file_path, {})
-                tool_name = tool_info.get("tool_name", "Unknown")
+                tool_name = self._modifying_tools.get(file_path, "Unknown")
 
                 # Resolve absolute path
                 abs_path = GitUtils.resolve_absolute_path(file_path, self.working_dir)
@@ -16,11 +16,12 @@ Usage:
     print(agent.id)  # Works with both UUID objects and strings
 """
 
+import json
 from datetime import datetime
 from decimal import Decimal
 from typing import Dict, Any, Optional, Literal
 from uuid import UUID
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 # ═══════════════════════════════════════════════════════════
@@ -68,16 +69,11 @@ class OrchestratorAgent(BaseModel):
     def parse_metadata(cls, v):
         """Parse JSON string metadata to dict"""
         if isinstance(v, str):
-            import json
             return json.loads(v)
         return v
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            UUID: str,
-            datetime: lambda v: v.isoformat()
-        }
+    # Schema is built on first use rather than at import
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # ═══════════════════════════════════════════════════════════
@@ -131,16 +127,11 @@ class Agent(BaseModel):
     def parse_metadata(cls, v):
         """Parse JSON string metadata to dict"""
         if isinstance(v, str):
-            import json
             return json.loads(v)
         return v
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            UUID: str,
-            datetime: lambda v: v.isoformat()
-        }
+    # Schema is built on first use rather than at import
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # ═══════════════════════════════════════════════════════════
@@ -173,12 +164,8 @@ class Prompt(BaseModel):
             return v
         return UUID(str(v))
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            UUID: str,
-            datetime: lambda v: v.isoformat()
-        }
+    # Schema is built on first use rather than at import
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # ═══════════════════════════════════════════════════════════
@@ -219,16 +206,11 @@ class AgentLog(BaseModel):
     def parse_payload(cls, v):
         """Parse JSON string payload to dict"""
         if isinstance(v, str):
-            import json
             return json.loads(v)
         return v
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            UUID: str,
-            datetime: lambda v: v.isoformat()
-        }
+    # Schema is built on first use rather than at import
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # ═══════════════════════════════════════════════════════════
@@ -269,16 +251,11 @@ class SystemLog(BaseModel):
     def parse_metadata(cls, v):
         """Parse JSON string metadata to dict"""
         if isinstance(v, str):
-            import json
             return json.loads(v)
         return v
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            UUID: str,
-            datetime: lambda v: v.isoformat()
-        }
+    # Schema is built on first use rather than at import
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # ═══════════════════════════════════════════════════════════
@@ -318,16 +295,11 @@ class OrchestratorChat(BaseModel):
     def parse_metadata(cls, v):
         """Parse JSON string metadata to dict"""
         if isinstance(v, str):
-            import json
             return json.loads(v)
         return v
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            UUID: str,
-            datetime: lambda v: v.isoformat()
-        }
+    # Schema is built on first use rather than at import
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # ═══════════════════════════════════════════════════════════
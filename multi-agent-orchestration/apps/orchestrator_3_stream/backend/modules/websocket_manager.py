@@ -4,7 +4,9 @@ WebSocket Manager Module
 Handles WebSocket connections and event broadcasting for real-time updates
 """
 
-from typing import List, Dict, Any
+import asyncio
+import time
+from typing import List, Dict, Any, Optional, Set, Tuple
 from fastapi import WebSocket, WebSocketDisconnect
 import json
 from datetime import datetime
@@ -12,6 +14,29 @@ from .logger import get_logger
 
 logger = get_logger()
 
+# Agent logs arriving within this window (seconds) are sent as one frame
+LOG_BATCH_WINDOW = 0.03
+
+# Messages buffered per client before it is considered too slow and dropped
+SEND_QUEUE_SIZE = 256
+
+# (10 ms tick, ISO string) of the last formatted timestamp
+_last_iso: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Current local time as ISO 8601, formatted at most once per 10 ms."""
+    global _last_iso
+    tick = int(time.time() * 100)
+    if tick != _last_iso[0]:
+        _last_iso = (tick, datetime.fromtimestamp(tick / 100).isoformat())
+    return _last_iso[1]
+
+
+def _encode_message(data: dict) -> str:
+    """Serialize a broadcast payload to compact JSON text."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
 
 class WebSocketManager:
     """
@@ -19,21 +44,36 @@ class WebSocketManager:
     """
 
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # Connected clients mapped to their send queues. Keyed by socket so
+        # membership checks and removal are O(1) under reconnect churn.
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
         self.connection_metadata: Dict[WebSocket, Dict[str, Any]] = {}
+        self._writer_tasks: Dict[WebSocket, asyncio.Task] = {}
+        self._log_outbox: List[dict] = []
+        self._log_flush_task: Optional[asyncio.Task] = None
+        # Strong references to in-flight close tasks; asyncio only keeps weak
+        # ones, so an unreferenced task could be collected before it runs
+        self._close_tasks: Set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket, client_id: str = None):
         """
         Accept a new WebSocket connection and register it
         """
         await websocket.accept()
-        self.active_connections.append(websocket)
+
+        # Each client gets its own queue and writer task so a slow socket
+        # only ever backs up its own messages
+        queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self.active_connections[websocket] = queue
+        self._writer_tasks[websocket] = asyncio.create_task(
+            self._writer(websocket, queue)
+        )
 
         # Store metadata
         client_id = client_id or f"client_{len(self.active_connections)}"
         self.connection_metadata[websocket] = {
             "client_id": client_id,
-            "connected_at": datetime.now().isoformat(),
+            "connected_at": _now_iso(),
         }
 
         logger.success(
@@ -47,7 +87,7 @@ class WebSocketManager:
             {
                 "type": "connection_established",
                 "client_id": client_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "message": "Connected to Orchestrator Backend",
             },
         )
@@ -56,12 +96,13 @@ class WebSocketManager:
         """
         Remove a WebSocket connection from the active list
         """
-        if websocket in self.active_connections:
-            metadata = self.connection_metadata.get(websocket, {})
-            client_id = metadata.get("client_id", "unknown")
+        writer = self._writer_tasks.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
 
-            self.active_connections.remove(websocket)
-            self.connection_metadata.pop(websocket, None)
+        if self.active_connections.pop(websocket, None) is not None:
+            metadata = self.connection_metadata.pop(websocket, {})
+            client_id = metadata.get("client_id", "unknown")
 
             logger.warning(
                 f"WebSocket client disconnected: {client_id} | "
@@ -72,46 +113,87 @@ class WebSocketManager:
         """
         Send JSON data to a specific client
         """
-        try:
-            await websocket.send_json(data)
+        if self._enqueue(websocket, _encode_message(data)):
             logger.debug(f"📤 Sent to client: {data.get('type', 'unknown')}")
+
+    def _enqueue(self, websocket: WebSocket, text: str) -> bool:
+        """
+        Queue encoded text for a client's writer task.
+
+        A client whose queue is full has stopped keeping up; it is dropped
+        rather than letting its backlog grow without bound.
+        """
+        queue = self.active_connections.get(websocket)
+        if queue is None:
+            return False
+
+        try:
+            queue.put_nowait(text)
+        except asyncio.QueueFull:
+            client_id = self.connection_metadata.get(websocket, {}).get("client_id", "unknown")
+            logger.error(f"Send queue full for client {client_id}, dropping connection")
+            self.disconnect(websocket)
+            task = asyncio.create_task(self._close(websocket))
+            self._close_tasks.add(task)
+            task.add_done_callback(self._close_tasks.discard)
+            return False
+        return True
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """
+        Send queued messages to one client in order until it disconnects
+        """
+        try:
+            while True:
+                text = await queue.get()
+                await websocket.send_text(text)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error(f"Failed to send to client: {e}")
             self.disconnect(websocket)
 
+    async def _close(self, websocket: WebSocket):
+        """Close a dropped client's socket, ignoring errors if it's already gone"""
+        try:
+            await websocket.close(code=1013)
+        except Exception:
+            pass
+
     async def broadcast(self, data: dict, exclude: WebSocket = None):
         """
         Broadcast JSON data to all connected clients (except optionally one)
         """
         if not self.active_connections:
             logger.debug(f"No active connections, skipping broadcast: {data.get('type')}")
+            # Drop logs queued for clients that have since disconnected so
+            # they are not replayed to the next client that connects
+            self._log_outbox.clear()
             return
 
+        # Deliver queued agent logs first so clients see events in order
+        if self._log_outbox:
+            await self._flush_log_outbox()
+
         event_type = data.get("type", "unknown")
         logger.websocket_event(event_type, {k: v for k, v in data.items() if k != "type"})
 
         # Add timestamp if not present
         if "timestamp" not in data:
-            data["timestamp"] = datetime.now().isoformat()
-
-        disconnected = []
-
-        for connection in self.active_connections:
-            if connection == exclude:
-                continue
+            data["timestamp"] = _now_iso()
 
-            try:
-                await connection.send_json(data)
-            except Exception as e:
-                logger.error(f"Failed to broadcast to client: {e}")
-                disconnected.append(connection)
+        # Encode once and send the same text to every client; send_json would
+        # re-run json.dumps on the payload for each connection
+        text = _encode_message(data)
 
-        # Clean up disconnected clients
-        for ws in disconnected:
-            self.disconnect(ws)
+        # Hand the text to each client's writer task; nothing here waits on
+        # a socket. Iterate over a copy since a full queue drops its client.
+        for connection in list(self.active_connections):
+            if connection != exclude:
+                self._enqueue(connection, text)
 
         logger.debug(
-            f"📡 Broadcast complete: {event_type} → {len(self.active_connections) - len(disconnected)} clients"
+            f"📡 Broadcast complete: {event_type} → {len(self.active_connections)} clients"
         )
 
     # ========================================================================
@@ -146,8 +228,41 @@ class WebSocketManager:
         )
 
     async def broadcast_agent_log(self, log_data: dict):
-        """Broadcast agent log entry"""
-        await self.broadcast({"type": "agent_log", "log": log_data})
+        """
+        Broadcast agent log entry.
+
+        Hooks emit several logs per tool call, so entries are queued and
+        flushed after LOG_BATCH_WINDOW as a single "batch" frame.
+        """
+        if not self.active_connections:
+            return
+
+        self._log_outbox.append(
+            {
+                "type": "agent_log",
+                "log": log_data,
+                "timestamp": _now_iso(),
+            }
+        )
+        if self._log_flush_task is None:
+            self._log_flush_task = asyncio.create_task(self._flush_log_outbox_later())
+
+    async def _flush_log_outbox_later(self):
+        """Flush the agent log outbox once the batching window has passed"""
+        await asyncio.sleep(LOG_BATCH_WINDOW)
+        self._log_flush_task = None
+        await self._flush_log_outbox()
+
+    async def _flush_log_outbox(self):
+        """Send all queued agent logs, batching them if there is more than one"""
+        items, self._log_outbox = self._log_outbox, []
+        if not items:
+            return
+
+        if len(items) == 1:
+            await self.broadcast(items[0])
+        else:
+            await self.broadcast({"type": "batch", "items": items})
 
     async def broadcast_agent_summary_update(self, agent_id: str, summary: str):
         """Broadcast agent summary update (latest log summary for an agent)"""
@@ -199,7 +314,7 @@ class WebSocketManager:
                 "orchestrator_agent_id": orchestrator_agent_id,
                 "chunk": chunk,
                 "is_complete": is_complete,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
             }
         )
 
@@ -218,7 +333,7 @@ class WebSocketManager:
                 "type": "chat_typing",
                 "orchestrator_agent_id": orchestrator_agent_id,
                 "is_typing": is_typing,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
             }
         )
 
@@ -242,7 +357,7 @@ class WebSocketManager:
         await self.broadcast(
             {
                 "type": "heartbeat",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "active_connections": self.get_connection_count(),
             }
         )
@@ -28,37 +28,40 @@ async def listen_for_agent_events():
                     message = await websocket.recv()
                     data = json.loads(message)
 
-                    # Filter for agent_log events
-                    if data.get("type") == "agent_log":
-                        log = data.get("log", {})
-                        print(f"\n🎯 AGENT EVENT RECEIVED at {datetime.now().strftime('%H:%M:%S')}")
-                        print(f"   Type: {log.get('event_type')}")
-                        print(f"   Category: {log.get('event_category')}")
-                        print(f"   Agent ID: {log.get('agent_id')}")
-                        print(f"   Content: {log.get('content', 'N/A')[:100]}")
-
-                        # Special handling for different event types
-                        if log.get('event_type') == 'TextBlock':
-                            print(f"   📝 Agent Response: {log.get('content', '')[:200]}")
-                        elif log.get('event_type') == 'ThinkingBlock':
-                            print(f"   🤔 Agent Thinking...")
-                        elif log.get('event_type') == 'ToolUseBlock':
-                            payload = log.get('payload', {})
-                            print(f"   🔧 Tool Use: {payload.get('tool_name', 'unknown')}")
-                        elif log.get('event_type') in ['PreToolUse', 'PostToolUse']:
-                            payload = log.get('payload', {})
-                            print(f"   🛠️ Hook: {payload.get('tool_name', 'unknown')}")
-
-                    elif data.get("type") == "agent_status_changed":
-                        print(f"\n📊 Agent Status Changed: {data.get('old_status')} → {data.get('new_status')}")
-
-                    elif data.get("type") == "agent_created":
-                        agent = data.get('agent', {})
-                        print(f"\n🆕 Agent Created: {agent.get('name')} (ID: {agent.get('id')})")
-
-                    # Ignore connection established and heartbeat messages
-                    elif data.get("type") not in ["connection_established", "heartbeat"]:
-                        print(f"\n📨 Other event: {data.get('type')}")
+                    # The backend coalesces bursts of agent logs into "batch" frames
+                    messages = data.get("items", []) if data.get("type") == "batch" else [data]
+                    for data in messages:
+                        # Filter for agent_log events
+                        if data.get("type") == "agent_log":
+                            log = data.get("log", {})
+                            print(f"\n🎯 AGENT EVENT RECEIVED at {datetime.now().strftime('%H:%M:%S')}")
+                            print(f"   Type: {log.get('event_type')}")
+                            print(f"   Category: {log.get('event_category')}")
+                            print(f"   Agent ID: {log.get('agent_id')}")
+                            print(f"   Content: {log.get('content', 'N/A')[:100]}")
+
+                            # Special handling for different event types
+                            if log.get('event_type') == 'TextBlock':
+                                print(f"   📝 Agent Response: {log.get('content', '')[:200]}")
+                            elif log.get('event_type') == 'ThinkingBlock':
+                                print(f"   🤔 Agent Thinking...")
+                            elif log.get('event_type') == 'ToolUseBlock':
+                                payload = log.get('payload', {})
+                                print(f"   🔧 Tool Use: {payload.get('tool_name', 'unknown')}")
+                            elif log.get('event_type') in ['PreToolUse', 'PostToolUse']:
+                                payload = log.get('payload', {})
+                                print(f"   🛠️ Hook: {payload.get('tool_name', 'unknown')}")
+
+                        elif data.get("type") == "agent_status_changed":
+                            print(f"\n📊 Agent Status Changed: {data.get('old_status')} → {data.get('new_status')}")
+
+                        elif data.get("type") == "agent_created":
+                            agent = data.get('agent', {})
+                            print(f"\n🆕 Agent Created: {agent.get('name')} (ID: {agent.get('id')})")
+
+                        # Ignore connection established and heartbeat messages
+                        elif data.get("type") not in ["connection_established", "heartbeat"]:
+                            print(f"\n📨 Other event: {data.get('type')}")
 
                 except websockets.exceptions.ConnectionClosed:
                     print("\n❌ WebSocket connection closed")
@@ -34,28 +34,31 @@ async def monitor_agent_events():
                         message = await websocket.recv()
                         data = json.loads(message)
 
-                        # Process agent_log events only
-                        if data.get("type") == "agent_log":
-                            log = data.get("log", {})
+                        # The backend coalesces bursts of agent logs into "batch" frames
+                        messages = data.get("items", []) if data.get("type") == "batch" else [data]
+                        for data in messages:
+                            # Process agent_log events only
+                            if data.get("type") == "agent_log":
+                                log = data.get("log", {})
 
-                            # Extract fields
-                            timestamp = datetime.now().strftime("%H:%M:%S")
-                            agent_name = log.get("agent_name", f"ID:{log.get('agent_id', 'unknown')[-4:]}")
-                            event_type = log.get("event_type", "unknown")
+                                # Extract fields
+                                timestamp = datetime.now().strftime("%H:%M:%S")
+                                agent_name = log.get("agent_name", f"ID:{log.get('agent_id', 'unknown')[-4:]}")
+                                event_type = log.get("event_type", "unknown")
 
-                            # Extract content based on event type
-                            if "Tool" in event_type:
-                                tool_name = log.get("payload", {}).get("tool_name", "unknown")
-                                content = f"🔧 {tool_name}"
-                            else:
-                                content = (log.get("summary") or log.get("content") or "—")[:50]
+                                # Extract content based on event type
+                                if "Tool" in event_type:
+                                    tool_name = log.get("payload", {}).get("tool_name", "unknown")
+                                    content = f"🔧 {tool_name}"
+                                else:
+                                    content = (log.get("summary") or log.get("content") or "—")[:50]
 
-                            # Add row and maintain table size
-                            table.add_row(timestamp, agent_name, event_type, content)
-                            if len(table.rows) > 20:
-                                table.rows = table.rows[-20:]
+                                # Add row and maintain table size
+                                table.add_row(timestamp, agent_name, event_type, content)
+                                if len(table.rows) > 20:
+                                    table.rows = table.rows[-20:]
 
-                            live.update(table)
+                                live.update(table)
 
                     except websockets.exceptions.ConnectionClosed:
                         console.print("\n[red]Connection closed[/red]")
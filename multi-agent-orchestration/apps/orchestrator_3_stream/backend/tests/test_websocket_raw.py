@@ -24,29 +24,32 @@ async def log_all_messages():
                     message = await websocket.recv()
                     data = json.loads(message)
 
-                    msg_type = data.get("type", "unknown")
-                    timestamp = datetime.now().strftime("%H:%M:%S")
+                    # The backend coalesces bursts of agent logs into "batch" frames
+                    messages = data.get("items", []) if data.get("type") == "batch" else [data]
+                    for data in messages:
+                        msg_type = data.get("type", "unknown")
+                        timestamp = datetime.now().strftime("%H:%M:%S")
 
-                    # Log everything except heartbeats and connection messages
-                    if msg_type not in ["heartbeat", "connection_established"]:
-                        print(f"\n[{timestamp}] Type: {msg_type}")
+                        # Log everything except heartbeats and connection messages
+                        if msg_type not in ["heartbeat", "connection_established"]:
+                            print(f"\n[{timestamp}] Type: {msg_type}")
 
-                        # Special handling for agent_log
-                        if msg_type == "agent_log":
-                            log = data.get("log", {})
-                            print(f"  Agent ID: {log.get('agent_id', 'N/A')}")
-                            print(f"  Agent Name: {log.get('agent_name', 'MISSING!')}")
-                            print(f"  Event Type: {log.get('event_type', 'N/A')}")
-                            print(f"  Event Category: {log.get('event_category', 'N/A')}")
-                            print(f"  Content: {str(log.get('content', 'N/A'))[:100]}")
-                            if log.get('payload', {}).get('tool_name'):
-                                print(f"  Tool: {log['payload']['tool_name']}")
+                            # Special handling for agent_log
+                            if msg_type == "agent_log":
+                                log = data.get("log", {})
+                                print(f"  Agent ID: {log.get('agent_id', 'N/A')}")
+                                print(f"  Agent Name: {log.get('agent_name', 'MISSING!')}")
+                                print(f"  Event Type: {log.get('event_type', 'N/A')}")
+                                print(f"  Event Category: {log.get('event_category', 'N/A')}")
+                                print(f"  Content: {str(log.get('content', 'N/A'))[:100]}")
+                                if log.get('payload', {}).get('tool_name'):
+                                    print(f"  Tool: {log['payload']['tool_name']}")
 
-                        # Log other message types
-                        else:
-                            print(f"  Data: {json.dumps(data, indent=2)[:500]}")
+                            # Log other message types
+                            else:
+                                print(f"  Data: {json.dumps(data, indent=2)[:500]}")
 
-                        print("-" * 80)
+                            print("-" * 80)
 
                 except websockets.exceptions.ConnectionClosed:
                     print("\n❌ Connection closed")
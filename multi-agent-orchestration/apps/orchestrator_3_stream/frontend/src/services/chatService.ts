@@ -82,74 +82,83 @@ export function connectWebSocket(
     callbacks.onConnected?.()
   }
 
+  const routeMessage = (message: any) => {
+    // Route by message type
+    switch (message.type) {
+      case 'batch':
+        // Agent logs coalesced server-side into a single frame
+        for (const item of message.items || []) {
+          routeMessage(item)
+        }
+        break
+
+      case 'chat_stream':
+        callbacks.onChatStream(
+          message.chunk || '',
+          message.is_complete || false
+        )
+        break
+
+      case 'chat_typing':
+        callbacks.onTyping(message.is_typing || false)
+        break
+
+      case 'agent_log':
+        callbacks.onAgentLog?.(message)
+        break
+
+      case 'orchestrator_chat':
+        callbacks.onOrchestratorChat?.(message)
+        break
+
+      case 'thinking_block':
+        callbacks.onThinkingBlock?.(message)
+        break
+
+      case 'tool_use_block':
+        callbacks.onToolUseBlock?.(message)
+        break
+
+      case 'agent_created':
+        callbacks.onAgentCreated?.(message)
+        break
+
+      case 'agent_updated':
+        callbacks.onAgentUpdated?.(message)
+        break
+
+      case 'agent_deleted':
+        callbacks.onAgentDeleted?.(message)
+        break
+
+      case 'agent_status_changed':
+        callbacks.onAgentStatusChange?.(message)
+        break
+
+      case 'agent_summary_update':
+        callbacks.onAgentSummaryUpdate?.(message)
+        break
+
+      case 'orchestrator_updated':
+        callbacks.onOrchestratorUpdated?.(message)
+        break
+
+      case 'error':
+        callbacks.onError(message)
+        break
+
+      case 'connection_established':
+        console.log('WebSocket connection established:', message.client_id)
+        break
+
+      default:
+        console.log('Unknown message type:', message.type)
+    }
+  }
+
   ws.onmessage = (event) => {
     try {
-      const message = JSON.parse(event.data)
-
-      // Route by message type
-      switch (message.type) {
-        case 'chat_stream':
-          callbacks.onChatStream(
-            message.chunk || '',
-            message.is_complete || false
-          )
-          break
-
-        case 'chat_typing':
-          callbacks.onTyping(message.is_typing || false)
-          break
-
-        case 'agent_log':
-          callbacks.onAgentLog?.(message)
-          break
-
-        case 'orchestrator_chat':
-          callbacks.onOrchestratorChat?.(message)
-          break
-
-        case 'thinking_block':
-          callbacks.onThinkingBlock?.(message)
-          break
-
-        case 'tool_use_block':
-          callbacks.onToolUseBlock?.(message)
-          break
-
-        case 'agent_created':
-          callbacks.onAgentCreated?.(message)
-          break
-
-        case 'agent_updated':
-          callbacks.onAgentUpdated?.(message)
-          break
-
-        case 'agent_deleted':
-          callbacks.onAgentDeleted?.(message)
-          break
-
-        case 'agent_status_changed':
-          callbacks.onAgentStatusChange?.(message)
-          break
-
-        case 'agent_summary_update':
-          callbacks.onAgentSummaryUpdate?.(message)
-          break
-
-        case 'orchestrator_updated':
-          callbacks.onOrchestratorUpdated?.(message)
-          break
-
-        case 'error':
-          callbacks.onError(message)
-          break
-
-        case 'connection_established':
-          console.log('WebSocket connection established:', message.client_id)
-          break
-
-        default:
-          console.log('Unknown message type:', message.type)
-      }
+      routeMessage(JSON.parse(event.data))
     } catch (error) {
       console.error('Failed to parse WebSocket message:', error)
     }
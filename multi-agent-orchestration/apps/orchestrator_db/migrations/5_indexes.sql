@@ -33,6 +33,9 @@ CREATE INDEX IF NOT EXISTS idx_agent_logs_type ON agent_logs(event_type);
 CREATE INDEX IF NOT EXISTS idx_agent_logs_category_type ON agent_logs(event_category, event_type);
 CREATE INDEX IF NOT EXISTS idx_agent_logs_timestamp ON agent_logs(timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_agent_logs_session ON agent_logs(session_id) WHERE session_id IS NOT NULL;
+-- Per-agent tails: WHERE agent_id AND task_slug ORDER BY entry_index, and WHERE agent_id ORDER BY timestamp
+CREATE INDEX IF NOT EXISTS idx_agent_logs_agent_task_index ON agent_logs(agent_id, task_slug, entry_index);
+CREATE INDEX IF NOT EXISTS idx_agent_logs_agent_timestamp ON agent_logs(agent_id, timestamp DESC);
 
 -- system_logs indexes
 CREATE INDEX IF NOT EXISTS idx_system_logs_level ON system_logs(level);
@@ -232,7 +232,7 @@ def main():
     
     # Finalize git operations (push and PR)
     # Note: This will work from the worktree context
-    finalize_git_operations(state, logger, cwd=worktree_path)
+    finalize_git_operations(state, logger, cwd=worktree_path, issue=issue)
     
     logger.info("Isolated implementation phase completed successfully")
     make_issue_comment(
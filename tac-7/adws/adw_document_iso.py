@@ -223,6 +223,8 @@ def track_agentic_kpis(
 
                 # Commit the KPI changes
                 try:
+                    # One timestamp for both fields of the synthetic issue
+                    now = datetime.now()
                     commit_msg, error = create_commit(
                         "kpi_tracker",
                         GitHubIssue(
@@ -231,8 +233,8 @@ def track_agentic_kpis(
                             body="Tracking ADW performance metrics",
                             state="open",
                             author=GitHubUser(login="system"),
-                            created_at=datetime.now(),
-                            updated_at=datetime.now(),
+                            created_at=now,
+                            updated_at=now,
                             url="",
                         ),
                         "/chore",
@@ -495,7 +497,7 @@ def main():
 
     # Finalize git operations (push and PR)
     # Note: This will work from the worktree context
-    finalize_git_operations(state, logger, cwd=worktree_path)
+    finalize_git_operations(state, logger, cwd=worktree_path, issue=issue)
 
     logger.info("Isolated documentation phase completed successfully")
     make_issue_comment(
@@ -6,7 +6,9 @@ import os
 import json
 import re
 import logging
+import random
 import time
+from collections import deque
 from typing import Optional, List, Dict, Any, Tuple, Final
 from dotenv import load_dotenv
 from .data_types import (
@@ -18,6 +20,7 @@ from .data_types import (
     ModelSet,
     RetryCode,
 )
+from .utils import PROJECT_ROOT
 
 # Load environment variables
 load_dotenv()
@@ -169,8 +172,9 @@ def parse_jsonl_output(
     """
     try:
         with open(output_file, "r") as f:
-            # Read all lines and parse each as JSON
-            messages = [json.loads(line) for line in f if line.strip()]
+            # Read all lines and parse each as JSON. json.loads ignores the
+            # trailing newline, so blank lines are skipped without a strip copy
+            messages = [json.loads(line) for line in f if not line.isspace()]
 
             # Find the result message (should be the last one)
             result_message = None
@@ -199,9 +203,10 @@ def convert_jsonl_to_json(jsonl_file: str) -> str:
     # Parse the JSONL file
     messages, _ = parse_jsonl_output(jsonl_file)
 
-    # Write as JSON array
+    # Write as JSON array. Encode in one call and write once; json.dump
+    # streams an indented encode through many small writes
     with open(json_file, "w") as f:
-        json.dump(messages, f, indent=2)
+        f.write(json.dumps(messages, indent=2))
 
     return json_file
 
@@ -234,11 +239,7 @@ def save_prompt(prompt: str, adw_id: str, agent_name: str = "ops") -> None:
     command_name = slash_command[1:]
 
     # Create directory structure at project root (parent of adws)
-    # __file__ is in adws/adw_modules/, so we need to go up 3 levels to get to project root
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
-    prompt_dir = os.path.join(project_root, "agents", adw_id, agent_name, "prompts")
+    prompt_dir = os.path.join(PROJECT_ROOT, "agents", adw_id, agent_name, "prompts")
     os.makedirs(prompt_dir, exist_ok=True)
 
     # Save prompt to file
@@ -257,7 +258,8 @@ def prompt_claude_code_with_retry(
     Args:
         request: The prompt request configuration
         max_retries: Maximum number of retry attempts (default: 3)
-        retry_delays: List of delays in seconds between retries (default: [1, 3, 5])
+        retry_delays: List of base delays in seconds between retries (default: [1, 3, 5]).
+            Each wait is jittered to 50-150% of its base delay.
 
     Returns:
         AgentPromptResponse with output and retry code
@@ -273,8 +275,9 @@ def prompt_claude_code_with_retry(
 
     for attempt in range(max_retries + 1):  # +1 for initial attempt
         if attempt > 0:
-            # This is a retry
-            delay = retry_delays[attempt - 1]
+            # This is a retry. Jitter the delay so parallel workflows hitting
+            # the same failure don't all retry Claude Code in lockstep
+            delay = retry_delays[attempt - 1] * (0.5 + random.random())
             time.sleep(delay)
 
         response = prompt_claude_code(request)
@@ -399,14 +402,13 @@ def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
                 # Try to get the last few lines of output for context
                 try:
                     with open(request.output_file, "r") as f:
-                        lines = f.readlines()
-                        if lines:
-                            # Get last 5 lines or less
-                            last_lines = lines[-5:] if len(lines) > 5 else lines
+                        # Keep only the last 5 lines rather than the whole file
+                        last_lines = deque(f, maxlen=5)
+                        if last_lines:
                             # Try to parse each as JSON to find any error messages
                             for line in reversed(last_lines):
                                 try:
-                                    data = json.loads(line.strip())
+                                    data = json.loads(line)
                                     if data.get("type") == "assistant" and data.get(
                                         "message"
                                     ):
@@ -462,7 +464,7 @@ def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
                     # If no structured error found, get last line only
                     if not error_from_jsonl:
                         with open(request.output_file, "r") as f:
-                            lines = f.readlines()
+                            lines = deque(f, maxlen=1)
                             if lines:
                                 # Just get the last line instead of entire file
                                 stdout_msg = lines[-1].strip()[
@@ -534,12 +536,8 @@ def execute_template(request: AgentTemplateRequest) -> AgentPromptResponse:
     prompt = f"{request.slash_command} {' '.join(request.args)}"
 
     # Create output directory with adw_id at project root
-    # __file__ is in adws/adw_modules/, so we need to go up 3 levels to get to project root
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
     output_dir = os.path.join(
-        project_root, "agents", request.adw_id, request.agent_name
+        PROJECT_ROOT, "agents", request.adw_id, request.agent_name
     )
     os.makedirs(output_dir, exist_ok=True)
 
@@ -3,6 +3,7 @@
 Provides centralized git operations that build on top of github.py module.
 """
 
+import os
 import subprocess
 import json
 import logging
@@ -10,10 +11,57 @@ from typing import Optional, Tuple
 
 # Import GitHub functions from existing module
 from adw_modules.github import get_repo_url, extract_repo_path, make_issue_comment
+from adw_modules.data_types import GitHubIssue
+from adw_modules.utils import find_worktree_root
+
+
+_HEAD_REF_PREFIX = "ref: refs/heads/"
+
+
+def _read_head_branch(cwd: Optional[str] = None) -> Optional[str]:
+    """Read the current branch straight from the HEAD file.
+
+    Handles both a regular .git directory and the .git file a linked
+    worktree uses to point at its gitdir. Returns "HEAD" when detached, to
+    match `git rev-parse --abbrev-ref HEAD`, and None for anything unusual
+    so the caller can fall back to git.
+    """
+    current = find_worktree_root(os.path.realpath(cwd or os.getcwd()))
+    if current is None:
+        return None
+
+    dot_git = os.path.join(current, ".git")
+    try:
+        if os.path.isdir(dot_git):
+            git_dir = dot_git
+        else:
+            with open(dot_git) as f:
+                content = f.read().strip()
+            if not content.startswith("gitdir: "):
+                return None
+            git_dir = os.path.join(current, content[len("gitdir: "):])
+        with open(os.path.join(git_dir, "HEAD")) as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+
+    if head.startswith(_HEAD_REF_PREFIX):
+        return head[len(_HEAD_REF_PREFIX):]
+    if head.startswith("ref: "):
+        return None  # Symbolic ref outside refs/heads; let git describe it
+    return "HEAD"
 
 
 def get_current_branch(cwd: Optional[str] = None) -> str:
-    """Get current git branch name."""
+    """Get current git branch name.
+
+    Reads .git/HEAD directly and only spawns git when the layout isn't one
+    _read_head_branch understands.
+    """
+    branch = _read_head_branch(cwd)
+    if branch is not None:
+        return branch
+
     result = subprocess.run(
         ["git", "rev-parse", "--abbrev-ref", "HEAD"],
         capture_output=True,
@@ -23,21 +71,32 @@ def get_current_branch(cwd: Optional[str] = None) -> str:
     return result.stdout.strip()
 
 
-def push_branch(
-    branch_name: str, cwd: Optional[str] = None
-) -> Tuple[bool, Optional[str]]:
-    """Push current branch to remote. Returns (success, error_message)."""
-    result = subprocess.run(
+def start_push(branch_name: str, cwd: Optional[str] = None) -> subprocess.Popen:
+    """Start pushing a branch to remote without waiting for it to finish."""
+    return subprocess.Popen(
         ["git", "push", "-u", "origin", branch_name],
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         text=True,
         cwd=cwd,
     )
-    if result.returncode != 0:
-        return False, result.stderr
+
+
+def wait_for_push(process: subprocess.Popen) -> Tuple[bool, Optional[str]]:
+    """Wait for a push started by start_push. Returns (success, error_message)."""
+    _, stderr = process.communicate()
+    if process.returncode != 0:
+        return False, stderr
     return True, None
 
 
+def push_branch(
+    branch_name: str, cwd: Optional[str] = None
+) -> Tuple[bool, Optional[str]]:
+    """Push current branch to remote. Returns (success, error_message)."""
+    return wait_for_push(start_push(branch_name, cwd=cwd))
+
+
 def check_pr_exists(branch_name: str) -> Optional[str]:
     """Check if PR exists for branch. Returns PR URL if exists."""
     # Use github.py functions to get repo info
@@ -98,13 +157,6 @@ def commit_changes(
     message: str, cwd: Optional[str] = None
 ) -> Tuple[bool, Optional[str]]:
     """Stage all changes and commit. Returns (success, error_message)."""
-    # Check if there are changes to commit
-    result = subprocess.run(
-        ["git", "status", "--porcelain"], capture_output=True, text=True, cwd=cwd
-    )
-    if not result.stdout.strip():
-        return True, None  # No changes to commit
-
     # Stage all changes
     result = subprocess.run(
         ["git", "add", "-A"], capture_output=True, text=True, cwd=cwd
@@ -112,11 +164,17 @@ def commit_changes(
     if result.returncode != 0:
         return False, result.stderr
 
-    # Commit
+    # Commit directly rather than checking `git status` first; only when the
+    # commit fails do we spend a process on asking whether anything was staged
     result = subprocess.run(
         ["git", "commit", "-m", message], capture_output=True, text=True, cwd=cwd
     )
     if result.returncode != 0:
+        staged = subprocess.run(
+            ["git", "diff", "--cached", "--quiet"], capture_output=True, cwd=cwd
+        )
+        if staged.returncode == 0:
+            return True, None  # No changes to commit
         return False, result.stderr
     return True, None
 
@@ -250,9 +308,16 @@ def merge_pr(
 
 
 def finalize_git_operations(
-    state: "ADWState", logger: logging.Logger, cwd: Optional[str] = None
+    state: "ADWState",
+    logger: logging.Logger,
+    cwd: Optional[str] = None,
+    issue: Optional[GitHubIssue] = None,
 ) -> None:
-    """Standard git finalization: push branch and create/update PR."""
+    """Standard git finalization: push branch and create/update PR.
+
+    Pass the issue the workflow already fetched to avoid fetching it
+    again from GitHub when a new PR has to be created.
+    """
     branch_name = state.get("branch_name")
     if not branch_name:
         # Fallback: use current git branch if not main
@@ -268,8 +333,12 @@ def finalize_git_operations(
             )
             return
 
-    # Always push
-    success, error = push_branch(branch_name, cwd=cwd)
+    # Always push. The existing-PR lookup doesn't depend on the push, so run
+    # it while the push is in flight instead of paying both round-trips
+    push_process = start_push(branch_name, cwd=cwd)
+    pr_url = check_pr_exists(branch_name)
+
+    success, error = wait_for_push(push_process)
     if not success:
         logger.error(f"Failed to push branch: {error}")
         return
@@ -277,7 +346,6 @@ def finalize_git_operations(
     logger.info(f"Pushed branch: {branch_name}")
 
     # Handle PR
-    pr_url = check_pr_exists(branch_name)
     issue_number = state.get("issue_number")
     adw_id = state.get("adw_id")
 
@@ -287,14 +355,15 @@ def finalize_git_operations(
         if issue_number and adw_id:
             make_issue_comment(issue_number, f"{adw_id}_ops: ✅ Pull request: {pr_url}")
     else:
-        # Create new PR - fetch issue data first
+        # Create new PR - fetch issue data first unless the caller has it
         if issue_number:
             try:
-                repo_url = get_repo_url()
-                repo_path = extract_repo_path(repo_url)
-                from adw_modules.github import fetch_issue
+                if issue is None:
+                    repo_url = get_repo_url()
+                    repo_path = extract_repo_path(repo_url)
+                    from adw_modules.github import fetch_issue
 
-                issue = fetch_issue(issue_number, repo_path)
+                    issue = fetch_issue(issue_number, repo_path)
 
                 from adw_modules.workflow_ops import create_pull_request
 
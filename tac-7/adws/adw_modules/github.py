@@ -13,6 +13,7 @@ This module contains all GitHub-related operations including:
 - Issue status management
 """
 
+import functools
 import subprocess
 import sys
 import os
@@ -52,14 +53,29 @@ def get_github_env() -> Optional[dict]:
     return env
 
 
-def get_repo_url() -> str:
-    """Get GitHub repository URL from git remote."""
+def get_repo_url(refresh: bool = False) -> str:
+    """Get GitHub repository URL from git remote.
+
+    The result is cached per working directory, so the many issue comments
+    and PR lookups in a workflow don't each spawn `git remote get-url`.
+
+    Args:
+        refresh: Bypass the cache and query git again
+    """
+    if refresh:
+        return _get_repo_url_for.__wrapped__(os.getcwd())
+    return _get_repo_url_for(os.getcwd())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_repo_url_for(cwd: str) -> str:
     try:
         result = subprocess.run(
             ["git", "remote", "get-url", "origin"],
             capture_output=True,
             text=True,
             check=True,
+            cwd=cwd,
         )
         return result.stdout.strip()
     except subprocess.CalledProcessError:
@@ -72,8 +88,9 @@ def get_repo_url() -> str:
 
 def extract_repo_path(github_url: str) -> str:
     """Extract owner/repo from GitHub URL."""
-    # Handle both https://github.com/owner/repo and https://github.com/owner/repo.git
-    return github_url.replace("https://github.com/", "").replace(".git", "")
+    # Handle both https://github.com/owner/repo and https://github.com/owner/repo.git.
+    # Strip only the affixes, so a ".git" inside a repo name survives
+    return github_url.removeprefix("https://github.com/").removesuffix(".git")
 
 
 def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
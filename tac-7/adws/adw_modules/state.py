@@ -4,19 +4,81 @@ Provides persistent state management via file storage and
 transient state passing between scripts via stdin/stdout.
 """
 
+import functools
 import json
 import os
 import sys
 import logging
-from typing import Dict, Any, Optional
-from adw_modules.data_types import ADWStateData
+from contextlib import contextmanager
+from typing import Dict, Any, Final, FrozenSet, Iterator, Optional, Tuple
+from adw_modules.utils import PROJECT_ROOT
+
+# Every state file lives under agents/ at the repo root
+_AGENTS_DIR = os.path.join(PROJECT_ROOT, "agents")
+
+
+@functools.lru_cache(maxsize=None)
+def _state_model():
+    """Import ADWStateData on first use.
+
+    data_types pulls in pydantic, which is slow to import; modules that only
+    need paths or ports (e.g. worktree_ops) shouldn't pay for it.
+    """
+    from adw_modules.data_types import ADWStateData
+
+    return ADWStateData
+
+
+def _dumps_state(data: Dict[str, Any]) -> bytes:
+    """Serialize state data to indented JSON bytes."""
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads_state(raw: bytes) -> Dict[str, Any]:
+    """Deserialize state data from JSON bytes."""
+    return json.loads(raw)
+
+
+def _stat_key(path: str) -> Tuple[int, int]:
+    """Return the (mtime_ns, size) pair used to validate cached state."""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _copy_state_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy state data so callers can't mutate cached entries."""
+    copied = dict(data)
+    copied["all_adws"] = list(data.get("all_adws") or [])
+    return copied
 
 
 class ADWState:
     """Container for ADW workflow state with file persistence."""
 
+    __slots__ = ("adw_id", "data", "logger")
+
     STATE_FILENAME = "adw_state.json"
 
+    # Fields update() accepts; anything else passed to it is ignored
+    CORE_FIELDS: Final[FrozenSet[str]] = frozenset(
+        {
+            "adw_id",
+            "issue_number",
+            "branch_name",
+            "plan_file",
+            "issue_class",
+            "worktree_path",
+            "backend_port",
+            "frontend_port",
+            "model_set",
+            "all_adws",
+        }
+    )
+
+    # Write-through cache of validated state keyed by state file path.
+    # Entries hold the file's (mtime_ns, size) so external writes invalidate them.
+    _state_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
     def __init__(self, adw_id: str):
         """Initialize ADWState with a required ADW ID.
         
@@ -34,9 +96,8 @@ class ADWState:
     def update(self, **kwargs):
         """Update state with new key-value pairs."""
         # Filter to only our core fields
-        core_fields = {"adw_id", "issue_number", "branch_name", "plan_file", "issue_class", "worktree_path", "backend_port", "frontend_port", "model_set", "all_adws"}
         for key, value in kwargs.items():
-            if key in core_fields:
+            if key in self.CORE_FIELDS:
                 self.data[key] = value
 
     def get(self, key: str, default=None):
@@ -61,78 +122,137 @@ class ADWState:
             return worktree_path
         
         # Return main repo path (parent of adws directory)
-        return os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
+        return PROJECT_ROOT
 
     def get_state_path(self) -> str:
         """Get path to state file."""
-        project_root = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        return os.path.join(project_root, "agents", self.adw_id, self.STATE_FILENAME)
+        return os.path.join(_AGENTS_DIR, self.adw_id, self.STATE_FILENAME)
+
+    def save(self, workflow_step: Optional[str] = None, durable: bool = False) -> None:
+        """Save state to file in agents/{adw_id}/adw_state.json.
+
+        The state is written to a temporary file and atomically renamed over
+        the target, so readers never observe a partially written file. The
+        write is skipped when the file already holds identical state.
 
-    def save(self, workflow_step: Optional[str] = None) -> None:
-        """Save state to file in agents/{adw_id}/adw_state.json."""
+        Args:
+            workflow_step: Optional name of the step updating the state
+            durable: fsync the file before the rename and its directory after
+                it, so the new state survives a crash (slower)
+        """
         state_path = self.get_state_path()
         os.makedirs(os.path.dirname(state_path), exist_ok=True)
 
-        # Create ADWStateData for validation
-        state_data = ADWStateData(
-            adw_id=self.data.get("adw_id"),
-            issue_number=self.data.get("issue_number"),
-            branch_name=self.data.get("branch_name"),
-            plan_file=self.data.get("plan_file"),
-            issue_class=self.data.get("issue_class"),
-            worktree_path=self.data.get("worktree_path"),
-            backend_port=self.data.get("backend_port"),
-            frontend_port=self.data.get("frontend_port"),
-            model_set=self.data.get("model_set", "base"),
-            all_adws=self.data.get("all_adws", []),
-        )
-
-        # Save as JSON
-        with open(state_path, "w") as f:
-            json.dump(state_data.model_dump(), f, indent=2)
-
-        self.logger.info(f"Saved state to {state_path}")
+        # Validate with ADWStateData in one pass over the state dict; missing
+        # fields take the model's defaults and non-core keys are ignored
+        state_data = _state_model().model_validate(self.data)
+
+        # Save as JSON. ADWStateData is flat, so a shallow field dict is
+        # enough for the encoder and avoids model_dump()'s recursive copy.
+        data = dict(state_data)
+        tmp_path = f"{state_path}.tmp.{os.getpid()}"
+        if not durable and self._is_unchanged_on_disk(state_path, data):
+            self.logger.debug("State unchanged, skipped write to %s", state_path)
+            return
+
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps_state(data))
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, state_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if durable:
+            # The rename itself is only durable once the directory is synced
+            dir_fd = os.open(os.path.dirname(state_path), os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        # data was built from the freshly validated model (whose all_adws
+        # list is a new object), so nothing else holds a reference to it
+        # and it can be cached without a defensive copy
+        ADWState._state_cache[state_path] = (_stat_key(state_path), data)
+
+        self.logger.info("Saved state to %s", state_path)
         if workflow_step:
-            self.logger.info(f"State updated by: {workflow_step}")
+            self.logger.info("State updated by: %s", workflow_step)
+
+    @staticmethod
+    def _is_unchanged_on_disk(state_path: str, data: Dict[str, Any]) -> bool:
+        """Check whether the state file already holds exactly this data."""
+        cached = ADWState._state_cache.get(state_path)
+        if not cached or cached[1] != data:
+            return False
+        try:
+            return _stat_key(state_path) == cached[0]
+        except FileNotFoundError:
+            return False
+
+    @classmethod
+    @contextmanager
+    def transaction(
+        cls, adw_id: str, workflow_step: Optional[str] = None
+    ) -> Iterator["ADWState"]:
+        """Load state once, yield it for mutation, and save once on exit.
+
+        Coalesces several update() calls into a single write. The state is
+        not saved if the block raises.
+
+        Example:
+            with ADWState.transaction(adw_id, "adw_plan_iso") as state:
+                state.update(issue_class=issue_command)
+                state.update(branch_name=branch_name)
+        """
+        state = cls.load(adw_id) or cls(adw_id)
+        yield state
+        state.save(workflow_step)
 
     @classmethod
     def load(
         cls, adw_id: str, logger: Optional[logging.Logger] = None
     ) -> Optional["ADWState"]:
         """Load state from file if it exists."""
-        project_root = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        state_path = os.path.join(project_root, "agents", adw_id, cls.STATE_FILENAME)
+        state_path = os.path.join(_AGENTS_DIR, adw_id, cls.STATE_FILENAME)
 
-        if not os.path.exists(state_path):
+        try:
+            stat_key = _stat_key(state_path)
+        except FileNotFoundError:
+            ADWState._state_cache.pop(state_path, None)
             return None
 
         try:
-            with open(state_path, "r") as f:
-                data = json.load(f)
-
-            # Validate with ADWStateData
-            state_data = ADWStateData(**data)
-
-            # Create ADWState instance
-            state = cls(state_data.adw_id)
-            state.data = state_data.model_dump()
-
-            if logger:
-                logger.info(f"🔍 Found existing state from {state_path}")
-                logger.info(f"State: {json.dumps(state_data.model_dump(), indent=2)}")
+            cached = ADWState._state_cache.get(state_path)
+            if cached and cached[0] == stat_key:
+                data = cached[1]
+            else:
+                with open(state_path, "rb") as f:
+                    raw = _loads_state(f.read())
 
-            return state
+                # Validate with ADWStateData
+                data = dict(_state_model()(**raw))
+                ADWState._state_cache[state_path] = (stat_key, data)
         except Exception as e:
             if logger:
-                logger.error(f"Failed to load state from {state_path}: {e}")
+                logger.error("Failed to load state from %s: %s", state_path, e)
             return None
 
+        # Create ADWState instance
+        state = cls(data["adw_id"])
+        state.data = _copy_state_data(data)
+
+        if logger:
+            logger.info("🔍 Found existing state from %s", state_path)
+            # Only pay for the JSON dump when it will actually be logged
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("State: %s", json.dumps(data, indent=2))
+
+        return state
+
     @classmethod
     def from_stdin(cls) -> Optional["ADWState"]:
         """Read state from stdin if available (for piped input).
@@ -1,16 +1,86 @@
 """Utility functions for ADW system."""
 
+import atexit
+import functools
 import json
 import logging
 import os
+import queue
 import re
 import sys
 import uuid
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, TypeVar, Type, Union, Dict, Optional
 
 T = TypeVar('T')
 
+# Repository root (parent of adws/), resolved once at import
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _FileLogRouter(logging.Handler):
+    """Hands queued records to the file handler of the ADW logger that emitted them.
+
+    One background listener serves every ADW logger in the process, so
+    long-running triggers don't start a thread per ADW ID.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._targets: Dict[str, logging.Handler] = {}
+
+    def set_target(self, logger_name: str, handler: logging.Handler) -> None:
+        """Route a logger's records to handler, closing the one it replaces."""
+        self.acquire()
+        try:
+            previous = self._targets.get(logger_name)
+            self._targets[logger_name] = handler
+        finally:
+            self.release()
+        # emit() runs under the same lock, so nothing is still writing to it
+        if previous is not None:
+            previous.close()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        target = self._targets.get(record.name)
+        if target is not None:
+            target.handle(record)
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            for handler in self._targets.values():
+                handler.close()
+            self._targets.clear()
+        finally:
+            self.release()
+        super().close()
+
+
+_file_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_file_log_router = _FileLogRouter()
+_file_log_listener: Optional[QueueListener] = None
+
+
+def _start_file_log_listener() -> None:
+    """Start the background execution.log writer on first use."""
+    global _file_log_listener
+    if _file_log_listener is not None:
+        return
+    _file_log_listener = QueueListener(_file_log_queue, _file_log_router)
+    _file_log_listener.start()
+    atexit.register(_stop_file_log_listener)
+
+
+def _stop_file_log_listener() -> None:
+    """Drain queued records to disk and close the log files."""
+    global _file_log_listener
+    if _file_log_listener is not None:
+        _file_log_listener.stop()
+        _file_log_listener = None
+    _file_log_router.close()
+
 
 def make_adw_id() -> str:
     """Generate a short 8-character UUID for ADW tracking."""
@@ -28,9 +98,7 @@ def setup_logger(adw_id: str, trigger_type: str = "adw_plan_build") -> logging.L
         Configured logger instance
     """
     # Create log directory: agents/{adw_id}/adw_plan_build/
-    # __file__ is in adws/adw_modules/, so we need to go up 3 levels to get to project root
-    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    log_dir = os.path.join(project_root, "agents", adw_id, trigger_type)
+    log_dir = os.path.join(PROJECT_ROOT, "agents", adw_id, trigger_type)
     os.makedirs(log_dir, exist_ok=True)
     
     # Log file path: agents/{adw_id}/adw_plan_build/execution.log
@@ -42,6 +110,7 @@ def setup_logger(adw_id: str, trigger_type: str = "adw_plan_build") -> logging.L
     
     # Clear any existing handlers to avoid duplicates
     logger.handlers.clear()
+    _start_file_log_listener()
     
     # File handler - captures everything
     file_handler = logging.FileHandler(log_file, mode='a')
@@ -63,7 +132,10 @@ def setup_logger(adw_id: str, trigger_type: str = "adw_plan_build") -> logging.L
     file_handler.setFormatter(file_formatter)
     console_handler.setFormatter(console_formatter)
     
-    logger.addHandler(file_handler)
+    # File writes happen on the background listener; the logger only enqueues.
+    # Console output stays synchronous so it keeps its order with print().
+    _file_log_router.set_target(logger.name, file_handler)
+    logger.addHandler(QueueHandler(_file_log_queue))
     logger.addHandler(console_handler)
     
     # Log initial setup message
@@ -186,6 +258,26 @@ def check_env_vars(logger: Optional[logging.Logger] = None) -> None:
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=None)
+def find_worktree_root(path: str) -> Optional[str]:
+    """Find the nearest directory at or above path that contains a .git entry.
+
+    Memoized per path, so repeated branch and worktree lookups from the same
+    directory don't re-walk the tree. Pass a realpath so symlinked spellings
+    share a cache entry.
+
+    Returns:
+        The working tree root, or None if path isn't inside a git checkout
+    """
+    current = path
+    while not os.path.exists(os.path.join(current, ".git")):
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+    return current
+
+
 def get_safe_subprocess_env() -> Dict[str, str]:
     """Get filtered environment variables safe for subprocess execution.
     
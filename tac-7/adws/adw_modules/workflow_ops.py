@@ -1,12 +1,11 @@
 """Shared AI Developer Workflow (ADW) operations."""
 
-import glob
 import json
 import logging
 import os
 import subprocess
 import re
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 from adw_modules.data_types import (
     AgentTemplateRequest,
     GitHubIssue,
@@ -17,7 +16,7 @@ from adw_modules.data_types import (
 from adw_modules.agent import execute_template
 from adw_modules.github import get_repo_url, extract_repo_path, ADW_BOT_IDENTIFIER
 from adw_modules.state import ADWState
-from adw_modules.utils import parse_json
+from adw_modules.utils import PROJECT_ROOT, parse_json
 
 
 # Agent name constants
@@ -46,6 +45,11 @@ AVAILABLE_ADW_WORKFLOWS = [
     "adw_sdlc_iso",
 ]
 
+# Classifier output may include explanation around the command, so pick out
+# the first command token in one compiled scan
+_CLASSIFICATION_RE = re.compile(r"(/chore|/bug|/feature|0)")
+_ISSUE_CLASS_COMMANDS = frozenset(("/chore", "/bug", "/feature"))
+
 
 def format_issue_message(
     adw_id: str, agent_name: str, message: str, session_id: Optional[str] = None
@@ -139,7 +143,7 @@ def classify_issue(
 
     # Look for the classification pattern in the output
     # Claude might add explanation, so we need to extract just the command
-    classification_match = re.search(r"(/chore|/bug|/feature|0)", output)
+    classification_match = _CLASSIFICATION_RE.search(output)
 
     if classification_match:
         issue_command = classification_match.group(1)
@@ -149,7 +153,7 @@ def classify_issue(
     if issue_command == "0":
         return None, f"No command selected: {response.output}"
 
-    if issue_command not in ["/chore", "/bug", "/feature"]:
+    if issue_command not in _ISSUE_CLASS_COMMANDS:
         return None, f"Invalid command selected: {response.output}"
 
     return issue_command, None  # type: ignore
@@ -348,6 +352,29 @@ def create_pull_request(
     return pr_url, None
 
 
+def _find_spec_files(search_dir: str, prefix: str = "", contains: str = "") -> List[str]:
+    """Find specs/*.md files whose name starts with prefix and contains a substring.
+
+    Equivalent to glob("specs/{prefix}*{contains}*.md") but scans the directory
+    once with os.scandir and plain string checks instead of fnmatch.
+    """
+    specs_dir = os.path.join(search_dir, "specs")
+    matches = []
+    try:
+        with os.scandir(specs_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                # glob's leading wildcard never matches hidden files
+                if name.startswith(".") or not name.endswith(".md"):
+                    continue
+                stem = name[:-3]
+                if stem.startswith(prefix) and contains in stem[len(prefix):]:
+                    matches.append(os.path.join(specs_dir, name))
+    except OSError:
+        return []
+    return matches
+
+
 def ensure_plan_exists(state: ADWState, issue_number: str) -> str:
     """Find or error if no plan exists for issue.
     Used by isolated build workflows in standalone mode."""
@@ -363,7 +390,7 @@ def ensure_plan_exists(state: ADWState, issue_number: str) -> str:
     # Look for plan in branch name
     if f"-{issue_number}-" in branch:
         # Look for plan file
-        plans = glob.glob(f"specs/*{issue_number}*.md")
+        plans = _find_spec_files("", contains=issue_number)
         if plans:
             return plans[0]
 
@@ -373,12 +400,15 @@ def ensure_plan_exists(state: ADWState, issue_number: str) -> str:
     )
 
 
-def ensure_adw_id(
+def ensure_adw_state(
     issue_number: str,
     adw_id: Optional[str] = None,
     logger: Optional[logging.Logger] = None,
-) -> str:
-    """Get ADW ID or create a new one and initialize state.
+) -> ADWState:
+    """Get the state for an ADW ID, creating the ID and state as needed.
+
+    Same as ensure_adw_id, but returns the state it found or saved so the
+    caller doesn't have to load it back from disk.
 
     Args:
         issue_number: The issue number to find/create ADW ID for
@@ -386,7 +416,7 @@ def ensure_adw_id(
         logger: Optional logger instance
 
     Returns:
-        The ADW ID (existing or newly created)
+        The existing or newly created ADWState
     """
     # If ADW ID provided, check if state exists
     if adw_id:
@@ -396,7 +426,7 @@ def ensure_adw_id(
                 logger.info(f"Found existing ADW state for ID: {adw_id}")
             else:
                 print(f"Found existing ADW state for ID: {adw_id}")
-            return adw_id
+            return state
         # ADW ID provided but no state exists, create state
         state = ADWState(adw_id)
         state.update(adw_id=adw_id, issue_number=issue_number)
@@ -405,7 +435,7 @@ def ensure_adw_id(
             logger.info(f"Created new ADW state for provided ID: {adw_id}")
         else:
             print(f"Created new ADW state for provided ID: {adw_id}")
-        return adw_id
+        return state
 
     # No ADW ID provided, create new one with state
     from adw_modules.utils import make_adw_id
@@ -418,7 +448,25 @@ def ensure_adw_id(
         logger.info(f"Created new ADW ID and state: {new_adw_id}")
     else:
         print(f"Created new ADW ID and state: {new_adw_id}")
-    return new_adw_id
+    return state
+
+
+def ensure_adw_id(
+    issue_number: str,
+    adw_id: Optional[str] = None,
+    logger: Optional[logging.Logger] = None,
+) -> str:
+    """Get ADW ID or create a new one and initialize state.
+
+    Args:
+        issue_number: The issue number to find/create ADW ID for
+        adw_id: Optional existing ADW ID to use
+        logger: Optional logger instance
+
+    Returns:
+        The ADW ID (existing or newly created)
+    """
+    return ensure_adw_state(issue_number, adw_id, logger).adw_id
 
 
 def find_existing_branch_for_issue(
@@ -438,7 +486,7 @@ def find_existing_branch_for_issue(
 
     # Look for branch with standardized pattern: *-issue-{issue_number}-adw-{adw_id}-*
     for branch in branches:
-        branch = branch.strip().replace("* ", "").replace("remotes/origin/", "")
+        branch = branch.strip().removeprefix("* ").removeprefix("remotes/origin/")
         # Check for the standardized pattern
         if f"-issue-{issue_number}-" in branch:
             if adw_id and f"-adw-{adw_id}-" in branch:
@@ -457,11 +505,7 @@ def find_plan_for_issue(
     Returns path to plan file if found, None otherwise."""
     import os
 
-    # Get project root
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
-    agents_dir = os.path.join(project_root, "agents")
+    agents_dir = os.path.join(PROJECT_ROOT, "agents")
 
     if not os.path.exists(agents_dir):
         return None
@@ -473,14 +517,14 @@ def find_plan_for_issue(
             return plan_path
 
     # Otherwise, search all agent directories
-    for agent_id in os.listdir(agents_dir):
-        agent_path = os.path.join(agents_dir, agent_id)
-        if os.path.isdir(agent_path):
-            plan_path = os.path.join(agent_path, AGENT_PLANNER, "plan.md")
-            if os.path.exists(plan_path):
-                # Check if this plan is for our issue by reading branch info or checking commits
-                # For now, return the first plan found (can be improved)
-                return plan_path
+    with os.scandir(agents_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                plan_path = os.path.join(entry.path, AGENT_PLANNER, "plan.md")
+                if os.path.exists(plan_path):
+                    # Check if this plan is for our issue by reading branch info or checking commits
+                    # For now, return the first plan found (can be improved)
+                    return plan_path
 
     return None
 
@@ -624,14 +668,11 @@ def find_spec_file(state: ADWState, logger: logging.Logger) -> Optional[str]:
             adw_id = state.get("adw_id")
 
             # Look for spec files matching the pattern
-            import glob
-
             # Use worktree_path if provided, otherwise current directory
             search_dir = worktree_path if worktree_path else os.getcwd()
-            pattern = os.path.join(
-                search_dir, f"specs/issue-{issue_num}-adw-{adw_id}*.md"
+            spec_files = _find_spec_files(
+                search_dir, prefix=f"issue-{issue_num}-adw-{adw_id}"
             )
-            spec_files = glob.glob(pattern)
 
             if spec_files:
                 spec_file = spec_files[0]
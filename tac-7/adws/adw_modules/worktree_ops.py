@@ -4,12 +4,97 @@ Provides utilities for creating and managing git worktrees under trees/<adw_id>/
 and allocating unique ports for each isolated instance.
 """
 
+import hashlib
 import os
+import shutil
 import subprocess
 import logging
 import socket
-from typing import Tuple, Optional
+import time
+from typing import Tuple, Optional, Set
 from adw_modules.state import ADWState
+from adw_modules.utils import PROJECT_ROOT, find_worktree_root
+
+# Paths of registered git worktrees, reused for a short window so validating
+# several worktrees in a row shells out to git only once.
+GIT_WORKTREES_TTL_SECONDS = 2.0
+_git_worktrees_cache: Tuple[float, Set[str]] = (0.0, set())
+
+
+def get_git_worktree_paths(refresh: bool = False) -> Set[str]:
+    """Get the set of worktree paths registered with git.
+
+    Args:
+        refresh: Bypass the short-lived cache and query git again
+
+    Returns:
+        Set of real (symlink-resolved) worktree paths
+    """
+    global _git_worktrees_cache
+    fetched_at, paths = _git_worktrees_cache
+    if not refresh and time.monotonic() - fetched_at < GIT_WORKTREES_TTL_SECONDS:
+        return paths
+
+    paths = _read_worktree_paths_from_git_dir(os.getcwd())
+    if paths is None:
+        result = subprocess.run(
+            ["git", "worktree", "list", "--porcelain"], capture_output=True, text=True
+        )
+        paths = {
+            os.path.realpath(line[len("worktree "):])
+            for line in result.stdout.splitlines()
+            if line.startswith("worktree ")
+        }
+    _git_worktrees_cache = (time.monotonic(), paths)
+    return paths
+
+
+def _read_worktree_paths_from_git_dir(start_dir: str) -> Optional[Set[str]]:
+    """Read worktree paths straight from .git/worktrees/*/gitdir.
+
+    Avoids spawning git for the common layout (a non-bare repository with a
+    .git directory). Returns None for anything unusual so the caller can fall
+    back to `git worktree list`.
+    """
+    current = find_worktree_root(os.path.realpath(start_dir))
+    if current is None:
+        return None
+
+    dot_git = os.path.join(current, ".git")
+    try:
+        if os.path.isdir(dot_git):
+            common_dir = dot_git
+        else:
+            # Linked worktree: .git is a file pointing at .git/worktrees/<name>
+            with open(dot_git) as f:
+                content = f.read().strip()
+            if not content.startswith("gitdir: "):
+                return None
+            git_dir = os.path.join(current, content[len("gitdir: "):])
+            with open(os.path.join(git_dir, "commondir")) as f:
+                common_dir = os.path.join(git_dir, f.read().strip())
+        common_dir = os.path.realpath(common_dir)
+        if os.path.basename(common_dir) != ".git":
+            return None
+
+        paths = {os.path.dirname(common_dir)}
+        worktrees_dir = os.path.join(common_dir, "worktrees")
+        if os.path.isdir(worktrees_dir):
+            for name in os.listdir(worktrees_dir):
+                admin_dir = os.path.join(worktrees_dir, name)
+                with open(os.path.join(admin_dir, "gitdir")) as f:
+                    # Relative when git writes worktrees with --relative-paths
+                    gitdir = os.path.join(admin_dir, f.read().strip())
+                paths.add(os.path.realpath(os.path.dirname(gitdir)))
+        return paths
+    except OSError:
+        return None
+
+
+def invalidate_git_worktree_cache() -> None:
+    """Forget cached worktree paths after adding or removing a worktree."""
+    global _git_worktrees_cache
+    _git_worktrees_cache = (0.0, set())
 
 
 def create_worktree(adw_id: str, branch_name: str, logger: logging.Logger) -> Tuple[str, Optional[str]]:
@@ -24,13 +109,8 @@ def create_worktree(adw_id: str, branch_name: str, logger: logging.Logger) -> Tu
         Tuple of (worktree_path, error_message)
         worktree_path is the absolute path if successful, None if error
     """
-    # Get project root (parent of adws directory)
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
-    
     # Create trees directory if it doesn't exist
-    trees_dir = os.path.join(project_root, "trees")
+    trees_dir = os.path.join(PROJECT_ROOT, "trees")
     os.makedirs(trees_dir, exist_ok=True)
     
     # Construct worktree path
@@ -47,7 +127,7 @@ def create_worktree(adw_id: str, branch_name: str, logger: logging.Logger) -> Tu
         ["git", "fetch", "origin"], 
         capture_output=True, 
         text=True, 
-        cwd=project_root
+        cwd=PROJECT_ROOT
     )
     if fetch_result.returncode != 0:
         logger.warning(f"Failed to fetch from origin: {fetch_result.stderr}")
@@ -55,19 +135,20 @@ def create_worktree(adw_id: str, branch_name: str, logger: logging.Logger) -> Tu
     # Create the worktree using git, branching from origin/main
     # Use -b to create the branch as part of worktree creation
     cmd = ["git", "worktree", "add", "-b", branch_name, worktree_path, "origin/main"]
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd=project_root)
+    result = subprocess.run(cmd, capture_output=True, text=True, cwd=PROJECT_ROOT)
     
     if result.returncode != 0:
         # If branch already exists, try without -b
         if "already exists" in result.stderr:
             cmd = ["git", "worktree", "add", worktree_path, branch_name]
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=project_root)
+            result = subprocess.run(cmd, capture_output=True, text=True, cwd=PROJECT_ROOT)
             
         if result.returncode != 0:
             error_msg = f"Failed to create worktree: {result.stderr}"
             logger.error(error_msg)
             return None, error_msg
     
+    invalidate_git_worktree_cache()
     logger.info(f"Created worktree at {worktree_path} for branch {branch_name}")
     return worktree_path, None
 
@@ -96,9 +177,11 @@ def validate_worktree(adw_id: str, state: ADWState) -> Tuple[bool, Optional[str]
     if not os.path.exists(worktree_path):
         return False, f"Worktree directory not found: {worktree_path}"
     
-    # Check git knows about it
-    result = subprocess.run(["git", "worktree", "list"], capture_output=True, text=True)
-    if worktree_path not in result.stdout:
+    # Check git knows about it. Paths recorded by create_worktree are usually
+    # already canonical, so only resolve symlinks (an lstat per path
+    # component) when the recorded path itself isn't registered
+    git_paths = get_git_worktree_paths()
+    if worktree_path not in git_paths and os.path.realpath(worktree_path) not in git_paths:
         return False, "Worktree not registered with git"
     
     return True, None
@@ -113,10 +196,7 @@ def get_worktree_path(adw_id: str) -> str:
     Returns:
         Absolute path to worktree directory
     """
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
-    return os.path.join(project_root, "trees", adw_id)
+    return os.path.join(PROJECT_ROOT, "trees", adw_id)
 
 
 def remove_worktree(adw_id: str, logger: logging.Logger) -> Tuple[bool, Optional[str]]:
@@ -134,6 +214,7 @@ def remove_worktree(adw_id: str, logger: logging.Logger) -> Tuple[bool, Optional
     # First remove via git
     cmd = ["git", "worktree", "remove", worktree_path, "--force"]
     result = subprocess.run(cmd, capture_output=True, text=True)
+    invalidate_git_worktree_cache()
     
     if result.returncode != 0:
         # Try to clean up manually if git command failed
@@ -164,9 +245,11 @@ def setup_worktree_environment(worktree_path: str, backend_port: int, frontend_p
     ports_env_path = os.path.join(worktree_path, ".ports.env")
     
     with open(ports_env_path, "w") as f:
-        f.write(f"BACKEND_PORT={backend_port}\n")
-        f.write(f"FRONTEND_PORT={frontend_port}\n")
-        f.write(f"VITE_BACKEND_URL=http://localhost:{backend_port}\n")
+        f.write(
+            f"BACKEND_PORT={backend_port}\n"
+            f"FRONTEND_PORT={frontend_port}\n"
+            f"VITE_BACKEND_URL=http://localhost:{backend_port}\n"
+        )
     
     logger.info(f"Created .ports.env with Backend: {backend_port}, Frontend: {frontend_port}")
 
@@ -189,8 +272,10 @@ def get_ports_for_adw(adw_id: str) -> Tuple[int, int]:
         id_chars = ''.join(c for c in adw_id[:8] if c.isalnum())
         index = int(id_chars, 36) % 15
     except ValueError:
-        # Fallback to simple hash if conversion fails
-        index = hash(adw_id) % 15
+        # Fallback to a stable hash if conversion fails. The builtin hash()
+        # is salted per process (PYTHONHASHSEED), so it isn't deterministic.
+        digest = hashlib.blake2b(adw_id.encode("utf-8"), digest_size=8).digest()
+        index = int.from_bytes(digest, "big") % 15
     
     backend_port = 9100 + index
     frontend_port = 9200 + index
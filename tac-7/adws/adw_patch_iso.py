@@ -38,7 +38,6 @@ import subprocess
 from typing import Optional
 from dotenv import load_dotenv
 
-from adw_modules.state import ADWState
 from adw_modules.git_ops import commit_changes, finalize_git_operations
 from adw_modules.github import (
     fetch_issue,
@@ -50,7 +49,7 @@ from adw_modules.github import (
 from adw_modules.workflow_ops import (
     create_commit,
     format_issue_message,
-    ensure_adw_id,
+    ensure_adw_state,
     implement_plan,
     create_and_implement_patch,
     AGENT_IMPLEMENTOR,
@@ -59,7 +58,6 @@ from adw_modules.worktree_ops import (
     create_worktree,
     validate_worktree,
     get_ports_for_adw,
-    is_port_available,
     find_next_available_ports,
     setup_worktree_environment,
 )
@@ -153,10 +151,8 @@ def main():
 
     # Ensure ADW ID exists with initialized state
     temp_logger = setup_logger(adw_id, "adw_patch_iso") if adw_id else None
-    adw_id = ensure_adw_id(issue_number, adw_id, temp_logger)
-
-    # Load the state that was created/found by ensure_adw_id
-    state = ADWState.load(adw_id, temp_logger)
+    state = ensure_adw_state(issue_number, adw_id, temp_logger)
+    adw_id = state.adw_id
 
     # Ensure state has the adw_id field
     if not state.get("adw_id"):
@@ -270,15 +266,14 @@ def main():
             )
             sys.exit(1)
 
-        # Get deterministic ports for this ADW ID
-        backend_port, frontend_port = get_ports_for_adw(adw_id)
-
-        # Check if ports are available, find alternatives if not
-        if not is_port_available(backend_port) or not is_port_available(frontend_port):
+        # Probe from the deterministic ports for this ADW ID onwards; the
+        # first pair tried is the deterministic one, so it's probed only once
+        preferred_ports = get_ports_for_adw(adw_id)
+        backend_port, frontend_port = find_next_available_ports(adw_id)
+        if (backend_port, frontend_port) != preferred_ports:
             logger.warning(
-                f"Preferred ports {backend_port}/{frontend_port} not available, finding alternatives"
+                f"Preferred ports {preferred_ports[0]}/{preferred_ports[1]} not available, using alternatives"
             )
-            backend_port, frontend_port = find_next_available_ports(adw_id)
 
         logger.info(
             f"Allocated ports - Backend: {backend_port}, Frontend: {frontend_port}"
@@ -410,7 +405,7 @@ def main():
     )
 
     # Finalize git operations (push and PR) - passing cwd for worktree
-    finalize_git_operations(state, logger, cwd=worktree_path)
+    finalize_git_operations(state, logger, cwd=worktree_path, issue=issue)
 
     logger.info("Isolated patch workflow completed successfully")
     make_issue_comment(
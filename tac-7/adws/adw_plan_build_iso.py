@@ -19,8 +19,6 @@ import subprocess
 import sys
 import os
 
-# Add the parent directory to Python path to import modules
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from adw_modules.workflow_ops import ensure_adw_id
 
 
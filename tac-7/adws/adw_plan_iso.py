@@ -31,7 +31,6 @@ import json
 from typing import Optional
 from dotenv import load_dotenv
 
-from adw_modules.state import ADWState
 from adw_modules.git_ops import commit_changes, finalize_git_operations
 from adw_modules.github import (
     fetch_issue,
@@ -45,7 +44,7 @@ from adw_modules.workflow_ops import (
     generate_branch_name,
     create_commit,
     format_issue_message,
-    ensure_adw_id,
+    ensure_adw_state,
     AGENT_PLANNER,
 )
 from adw_modules.utils import setup_logger, check_env_vars
@@ -55,7 +54,6 @@ from adw_modules.worktree_ops import (
     create_worktree,
     validate_worktree,
     get_ports_for_adw,
-    is_port_available,
     find_next_available_ports,
     setup_worktree_environment,
 )
@@ -78,10 +76,8 @@ def main():
 
     # Ensure ADW ID exists with initialized state
     temp_logger = setup_logger(adw_id, "adw_plan_iso") if adw_id else None
-    adw_id = ensure_adw_id(issue_number, adw_id, temp_logger)
-
-    # Load the state that was created/found by ensure_adw_id
-    state = ADWState.load(adw_id, temp_logger)
+    state = ensure_adw_state(issue_number, adw_id, temp_logger)
+    adw_id = state.adw_id
 
     # Ensure state has the adw_id field
     if not state.get("adw_id"):
@@ -113,17 +109,16 @@ def main():
         backend_port = state.get("backend_port")
         frontend_port = state.get("frontend_port")
     else:
-        # Allocate ports for this instance
-        backend_port, frontend_port = get_ports_for_adw(adw_id)
-        
-        # Check port availability
-        if not (is_port_available(backend_port) and is_port_available(frontend_port)):
-            logger.warning(f"Deterministic ports {backend_port}/{frontend_port} are in use, finding alternatives")
-            backend_port, frontend_port = find_next_available_ports(adw_id)
+        # Allocate ports for this instance. The search starts at the
+        # deterministic pair, so it's probed only once
+        preferred_ports = get_ports_for_adw(adw_id)
+        backend_port, frontend_port = find_next_available_ports(adw_id)
+        if (backend_port, frontend_port) != preferred_ports:
+            logger.warning(f"Deterministic ports {preferred_ports[0]}/{preferred_ports[1]} are in use, using alternatives")
         
         logger.info(f"Allocated ports - Backend: {backend_port}, Frontend: {frontend_port}")
+        # Saved together with the classification and branch name below
         state.update(backend_port=backend_port, frontend_port=frontend_port)
-        state.save("adw_plan_iso")
 
     # Fetch issue details
     issue: GitHubIssue = fetch_issue(issue_number, repo_path)
@@ -150,7 +145,6 @@ def main():
         sys.exit(1)
 
     state.update(issue_class=issue_command)
-    state.save("adw_plan_iso")
     logger.info(f"Issue classified as: {issue_command}")
     make_issue_comment(
         issue_number,
@@ -171,7 +165,9 @@ def main():
         sys.exit(1)
 
     # Don't create branch here - let worktree create it
-    # The worktree command will create the branch when we specify -b
+    # The worktree command will create the branch when we specify -b.
+    # One save persists the ports, classification and branch name together;
+    # none of them is read back from disk before this point.
     state.update(branch_name=branch_name)
     state.save("adw_plan_iso")
     logger.info(f"Will create branch in worktree: {branch_name}")
@@ -317,7 +313,7 @@ def main():
 
     # Finalize git operations (push and PR)
     # Note: This will work from the worktree context
-    finalize_git_operations(state, logger, cwd=worktree_path)
+    finalize_git_operations(state, logger, cwd=worktree_path, issue=issue)
 
     logger.info("Isolated planning phase completed successfully")
     make_issue_comment(
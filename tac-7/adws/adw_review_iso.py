@@ -65,6 +65,13 @@ AGENT_REVIEW_PATCH_IMPLEMENTOR = "review_patch_implementor"
 # Maximum number of review retry attempts after resolution
 MAX_REVIEW_RETRY_ATTEMPTS = 3
 
+# Review summary sections in display order, keyed by issue severity
+REVIEW_SEVERITY_SECTIONS = (
+    ("blocker", "🚨 Blockers"),
+    ("tech_debt", "⚠️ Tech Debt"),
+    ("skippable", "💡 Skippable"),
+)
+
 
 
 
@@ -265,30 +272,18 @@ def build_review_summary(review_result: ReviewResult) -> str:
     if review_result.review_issues:
         summary_parts.append("\n## 🔍 Issues Found")
         
-        # Group by severity
-        blockers = [i for i in review_result.review_issues if i.issue_severity == "blocker"]
-        tech_debts = [i for i in review_result.review_issues if i.issue_severity == "tech_debt"]
-        skippables = [i for i in review_result.review_issues if i.issue_severity == "skippable"]
-        
-        if blockers:
-            summary_parts.append(f"\n### 🚨 Blockers ({len(blockers)})")
-            for issue in blockers:
-                summary_parts.append(f"- **Issue {issue.review_issue_number}**: {issue.issue_description}")
-                summary_parts.append(f"  - Resolution: {issue.issue_resolution}")
-                if issue.screenshot_url and issue.screenshot_url.startswith("http"):
-                    summary_parts.append(f"  - ![Issue Screenshot]({issue.screenshot_url})")
-        
-        if tech_debts:
-            summary_parts.append(f"\n### ⚠️ Tech Debt ({len(tech_debts)})")
-            for issue in tech_debts:
-                summary_parts.append(f"- **Issue {issue.review_issue_number}**: {issue.issue_description}")
-                summary_parts.append(f"  - Resolution: {issue.issue_resolution}")
-                if issue.screenshot_url and issue.screenshot_url.startswith("http"):
-                    summary_parts.append(f"  - ![Issue Screenshot]({issue.screenshot_url})")
+        # Group by severity in a single pass
+        by_severity = {severity: [] for severity, _ in REVIEW_SEVERITY_SECTIONS}
+        for issue in review_result.review_issues:
+            if issue.issue_severity in by_severity:
+                by_severity[issue.issue_severity].append(issue)
         
-        if skippables:
-            summary_parts.append(f"\n### 💡 Skippable ({len(skippables)})")
-            for issue in skippables:
+        for severity, heading in REVIEW_SEVERITY_SECTIONS:
+            issues = by_severity[severity]
+            if not issues:
+                continue
+            summary_parts.append(f"\n### {heading} ({len(issues)})")
+            for issue in issues:
                 summary_parts.append(f"- **Issue {issue.review_issue_number}**: {issue.issue_description}")
                 summary_parts.append(f"  - Resolution: {issue.issue_resolution}")
                 if issue.screenshot_url and issue.screenshot_url.startswith("http"):
@@ -514,7 +509,7 @@ def main():
     
     # Finalize git operations (push and PR)
     # Note: This will work from the worktree context
-    finalize_git_operations(state, logger, cwd=worktree_path)
+    finalize_git_operations(state, logger, cwd=worktree_path, issue=issue)
     
     logger.info("Isolated review phase completed successfully")
     make_issue_comment(
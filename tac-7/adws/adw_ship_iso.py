@@ -41,6 +41,7 @@ from adw_modules.github import (
     extract_repo_path,
 )
 from adw_modules.workflow_ops import format_issue_message
+from adw_modules.git_ops import get_current_branch
 from adw_modules.utils import setup_logger, check_env_vars
 from adw_modules.worktree_ops import validate_worktree
 from adw_modules.data_types import ADWStateData
@@ -72,11 +73,7 @@ def manual_merge_to_main(branch_name: str, logger: logging.Logger) -> Tuple[bool
     
     try:
         # Save current branch to restore later
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True, text=True, cwd=repo_root
-        )
-        original_branch = result.stdout.strip()
+        original_branch = get_current_branch(cwd=repo_root)
         logger.debug(f"Original branch: {original_branch}")
         
         # Step 1: Fetch latest from origin
@@ -301,8 +298,9 @@ def main():
                            f"🚢 Code has been deployed to production!")
     )
     
-    # Save final state
-    state.save("adw_ship_iso")
+    # Save final state. The branch is merged at this point, so make sure the
+    # record of it survives a crash rather than trusting the page cache
+    state.save("adw_ship_iso", durable=True)
     
     # Post final state summary
     make_issue_comment(
@@ -130,7 +130,7 @@ def format_test_results_comment(
             comment_parts.append(f"### {test.test_name}")
             comment_parts.append("")
             comment_parts.append("```json")
-            comment_parts.append(json.dumps(test.model_dump(), indent=2))
+            comment_parts.append(test.model_dump_json(indent=2))
             comment_parts.append("```")
             comment_parts.append("")
 
@@ -144,7 +144,7 @@ def format_test_results_comment(
             comment_parts.append(f"### {test.test_name}")
             comment_parts.append("")
             comment_parts.append("```json")
-            comment_parts.append(json.dumps(test.model_dump(), indent=2))
+            comment_parts.append(test.model_dump_json(indent=2))
             comment_parts.append("```")
             comment_parts.append("")
 
@@ -846,7 +846,7 @@ def main():
     
     # Finalize git operations (push and PR)
     # Note: This will work from the worktree context
-    finalize_git_operations(state, logger, cwd=worktree_path)
+    finalize_git_operations(state, logger, cwd=worktree_path, issue=issue)
     
     logger.info("Isolated testing phase completed successfully")
     make_issue_comment(
@@ -24,7 +24,7 @@ import os
 import sys
 import json
 import subprocess
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pathlib import Path
@@ -43,6 +43,10 @@ from adw_modules.utils import get_safe_subprocess_env
 # Load environment variables
 load_dotenv()
 
+# Limit for the quick CLI probes (`--version`, `gh auth status`). The webhook
+# runs these checks in-process, so every command needs a bound of its own.
+COMMAND_TIMEOUT_SECONDS = 10
+
 
 class CheckResult(BaseModel):
     """Individual check result."""
@@ -113,8 +117,9 @@ def check_env_vars() -> CheckResult:
 def check_git_repo() -> CheckResult:
     """Check git repository configuration using github module."""
     try:
-        # Get repo URL using the github module function
-        repo_url = get_repo_url()
+        # Get repo URL using the github module function. The webhook runs this
+        # check in a long-lived process, so skip the cached remote.
+        repo_url = get_repo_url(refresh=True)
         repo_path = extract_repo_path(repo_url)
 
         # Check if still using disler's repo
@@ -144,13 +149,21 @@ def check_claude_code() -> CheckResult:
     # First check if Claude Code is installed
     try:
         result = subprocess.run(
-            [claude_path, "--version"], capture_output=True, text=True
+            [claude_path, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=COMMAND_TIMEOUT_SECONDS,
         )
         if result.returncode != 0:
             return CheckResult(
                 success=False,
                 error=f"Claude Code CLI not functional at '{claude_path}'",
             )
+    except subprocess.TimeoutExpired:
+        return CheckResult(
+            success=False,
+            error=f"Claude Code CLI at '{claude_path}' timed out after {COMMAND_TIMEOUT_SECONDS} seconds",
+        )
     except FileNotFoundError:
         return CheckResult(
             success=False,
@@ -164,12 +177,6 @@ def check_claude_code() -> CheckResult:
     env = get_safe_subprocess_env()
 
     try:
-        # Create temporary file for output
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".jsonl", delete=False
-        ) as tmp:
-            output_file = tmp.name
-
         # Run Claude Code
         cmd = [
             claude_path,
@@ -183,10 +190,11 @@ def check_claude_code() -> CheckResult:
             "--dangerously-skip-permissions",
         ]
 
-        with open(output_file, "w") as f:
-            result = subprocess.run(
-                cmd, stdout=f, stderr=subprocess.PIPE, text=True, env=env, timeout=30
-            )
+        # The stream-json output is a handful of lines, so read it straight
+        # from the pipe rather than round-tripping through a temp file
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, env=env, timeout=30
+        )
 
         if result.returncode != 0:
             return CheckResult(
@@ -197,19 +205,13 @@ def check_claude_code() -> CheckResult:
         claude_responded = False
         response_text = ""
 
-        try:
-            with open(output_file, "r") as f:
-                for line in f:
-                    if line.strip():
-                        msg = json.loads(line)
-                        if msg.get("type") == "result":
-                            claude_responded = True
-                            response_text = msg.get("result", "")
-                            break
-        finally:
-            # Clean up temp file
-            if os.path.exists(output_file):
-                os.unlink(output_file)
+        for line in result.stdout.splitlines():
+            if line.strip():
+                msg = json.loads(line)
+                if msg.get("type") == "result":
+                    claude_responded = True
+                    response_text = msg.get("result", "")
+                    break
 
         return CheckResult(
             success=claude_responded,
@@ -231,7 +233,12 @@ def check_github_cli() -> CheckResult:
     """Check if GitHub CLI is installed and authenticated."""
     try:
         # Check if gh is installed
-        result = subprocess.run(["gh", "--version"], capture_output=True, text=True)
+        result = subprocess.run(
+            ["gh", "--version"],
+            capture_output=True,
+            text=True,
+            timeout=COMMAND_TIMEOUT_SECONDS,
+        )
         if result.returncode != 0:
             return CheckResult(success=False, error="GitHub CLI (gh) is not installed")
 
@@ -239,7 +246,11 @@ def check_github_cli() -> CheckResult:
         env = get_safe_subprocess_env()
 
         result = subprocess.run(
-            ["gh", "auth", "status"], capture_output=True, text=True, env=env
+            ["gh", "auth", "status"],
+            capture_output=True,
+            text=True,
+            env=env,
+            timeout=COMMAND_TIMEOUT_SECONDS,
         )
 
         authenticated = result.returncode == 0
@@ -250,6 +261,11 @@ def check_github_cli() -> CheckResult:
             details={"installed": True, "authenticated": authenticated},
         )
 
+    except subprocess.TimeoutExpired:
+        return CheckResult(
+            success=False,
+            error=f"GitHub CLI timed out after {COMMAND_TIMEOUT_SECONDS} seconds",
+        )
     except FileNotFoundError:
         return CheckResult(
             success=False,
@@ -278,8 +294,16 @@ def run_health_check() -> HealthCheckResult:
         )
     # Don't add warnings for optional env vars - they're optional!
 
+    # The remaining checks each shell out (git, gh, claude) and don't depend
+    # on one another, so run them concurrently and merge in a fixed order
+    has_api_key = bool(os.getenv("ANTHROPIC_API_KEY"))
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        git_future = executor.submit(check_git_repo)
+        gh_future = executor.submit(check_github_cli)
+        claude_future = executor.submit(check_claude_code) if has_api_key else None
+
     # Check git repository
-    git_check = check_git_repo()
+    git_check = git_future.result()
     result.checks["git_repository"] = git_check
     if not git_check.success:
         result.success = False
@@ -289,7 +313,7 @@ def run_health_check() -> HealthCheckResult:
         result.warnings.append(git_check.warning)
 
     # Check GitHub CLI
-    gh_check = check_github_cli()
+    gh_check = gh_future.result()
     result.checks["github_cli"] = gh_check
     if not gh_check.success:
         result.success = False
@@ -297,8 +321,8 @@ def run_health_check() -> HealthCheckResult:
             result.errors.append(gh_check.error)
 
     # Check Claude Code - only if we have the API key
-    if os.getenv("ANTHROPIC_API_KEY"):
-        claude_check = check_claude_code()
+    if claude_future is not None:
+        claude_check = claude_future.result()
         result.checks["claude_code"] = claude_check
         if not claude_check.success:
             result.success = False
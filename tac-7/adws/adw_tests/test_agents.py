@@ -136,12 +136,14 @@ def main():
     results = {}
     all_success = True
 
-    # Run tests in parallel
-    with ThreadPoolExecutor(max_workers=len(MODELS)) as executor:
+    # Run tests in parallel. The retry test writes its own output file, so it
+    # runs alongside the model tests instead of waiting for them to finish
+    with ThreadPoolExecutor(max_workers=len(MODELS) + 1) as executor:
         # Submit all test tasks
         future_to_model = {
             executor.submit(test_model, model, adw_id): model for model in MODELS
         }
+        future_to_model[executor.submit(test_retry_functionality, adw_id)] = "retry_test"
 
         # Process results as they complete
         for future in as_completed(future_to_model):
@@ -156,12 +158,6 @@ def main():
                 all_success = False
                 print(f"❌ {model} - Exception during parallel execution: {str(e)}")
 
-    # Run retry functionality test
-    retry_success, retry_message = test_retry_functionality(adw_id)
-    results["retry_test"] = (retry_success, retry_message)
-    if not retry_success:
-        all_success = False
-
     # Summary (ordered by original MODELS list + retry test)
     print(f"\n{'='*50}")
     print("Test Summary")
@@ -22,9 +22,12 @@ import os
 import signal
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Set, Optional
+from typing import Dict, Set, Optional, Tuple
 
 import schedule
 from dotenv import load_dotenv
@@ -49,6 +52,19 @@ except ValueError as e:
     print(f"ERROR: {e}")
     sys.exit(1)
 
+# Workflow launched for qualifying issues, resolved once at startup
+WORKFLOW_SCRIPT = Path(__file__).resolve().parent.parent / "adw_plan_build_iso.py"
+WORKFLOW_CMD_PREFIX = [sys.executable, str(WORKFLOW_SCRIPT)]
+
+# Max concurrent `gh` calls when checking issue comments
+COMMENT_FETCH_WORKERS = 8
+
+# Max ADW workflows run at once; each one works in its own isolated worktree
+MAX_CONCURRENT_WORKFLOWS = 4
+
+# Lines of workflow stderr kept for error reporting
+STDERR_TAIL_LINES = 50
+
 # Track processed issues
 processed_issues: Set[int] = set()
 # Track issues with their last processed comment ID
@@ -56,6 +72,8 @@ issue_last_comment: Dict[int, Optional[int]] = {}
 
 # Graceful shutdown flag
 shutdown_requested = False
+# Set alongside shutdown_requested to wake the scheduling loop immediately
+shutdown_event = threading.Event()
 
 
 def signal_handler(signum, frame):
@@ -63,16 +81,22 @@ def signal_handler(signum, frame):
     global shutdown_requested
     print(f"\nINFO: Received signal {signum}, initiating graceful shutdown...")
     shutdown_requested = True
+    shutdown_event.set()
 
 
-def should_process_issue(issue_number: int) -> bool:
-    """Determine if an issue should be processed based on comments."""
+def should_process_issue(issue_number: int) -> Tuple[bool, Optional[int]]:
+    """Determine if an issue should be processed based on comments.
+    
+    Runs on comment-fetch worker threads, so it only reads issue_last_comment.
+    Returns (should_process, comment_id); when comment_id is not None the
+    caller records it as the issue's last processed comment.
+    """
     comments = fetch_issue_comments(REPO_PATH, issue_number)
     
     # If no comments, it's a new issue - process it
     if not comments:
         print(f"INFO: Issue #{issue_number} has no comments - marking for processing")
-        return True
+        return True, None
     
     # Get the latest comment
     latest_comment = comments[-1]
@@ -83,43 +107,44 @@ def should_process_issue(issue_number: int) -> bool:
     last_processed_comment = issue_last_comment.get(issue_number)
     if last_processed_comment == comment_id:
         # DEBUG level - not printing
-        return False
+        return False, None
     
     # Check if latest comment is exactly 'adw' (after stripping whitespace)
     if comment_body.strip() == "adw":
         print(f"INFO: Issue #{issue_number} - latest comment is 'adw' - marking for processing")
-        issue_last_comment[issue_number] = comment_id
-        return True
+        return True, comment_id
     
     # DEBUG level - not printing
-    return False
+    return False, None
 
 
 def trigger_adw_workflow(issue_number: int) -> bool:
     """Trigger the ADW plan and build workflow for a specific issue."""
     try:
-        script_path = Path(__file__).parent.parent / "adw_plan_build_iso.py"
-        
         print(f"INFO: Triggering ADW workflow for issue #{issue_number}")
         
-        cmd = [sys.executable, str(script_path), str(issue_number)]
+        cmd = [*WORKFLOW_CMD_PREFIX, str(issue_number)]
         
-        # Run the manual trigger script with filtered environment
-        result = subprocess.run(
+        # Run the manual trigger script with filtered environment.
+        # stdout is never shown (DEBUG level), so discard it instead of
+        # buffering the whole run; stream stderr and keep only its tail.
+        process = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
-            cwd=script_path.parent,
+            cwd=WORKFLOW_SCRIPT.parent,
             env=get_safe_subprocess_env()
         )
+        stderr_tail = deque(process.stderr, maxlen=STDERR_TAIL_LINES)
+        returncode = process.wait()
         
-        if result.returncode == 0:
+        if returncode == 0:
             print(f"INFO: Successfully triggered workflow for issue #{issue_number}")
-            # DEBUG level - not printing output
             return True
         else:
             print(f"ERROR: Failed to trigger workflow for issue #{issue_number}")
-            print(f"ERROR: {result.stderr}")
+            print(f"ERROR: {''.join(stderr_tail)}")
             return False
             
     except Exception as e:
@@ -127,13 +152,20 @@ def trigger_adw_workflow(issue_number: int) -> bool:
         return False
 
 
+def trigger_unless_shutdown(issue_number: int) -> Optional[bool]:
+    """Trigger the workflow for an issue, or return None if shutting down."""
+    if shutdown_requested:
+        return None
+    return trigger_adw_workflow(issue_number)
+
+
 def check_and_process_issues():
     """Main function that checks for issues and processes qualifying ones."""
     if shutdown_requested:
         print(f"INFO: Shutdown requested, skipping check cycle")
         return
     
-    start_time = time.time()
+    start_time = time.monotonic()
     print(f"INFO: Starting issue check cycle")
     
     try:
@@ -144,42 +176,59 @@ def check_and_process_issues():
             print(f"INFO: No open issues found")
             return
         
-        # Track newly qualified issues
-        new_qualifying_issues = []
+        # Forget issues that are no longer open, so tracking stays bounded by
+        # the open issue count instead of growing for the whole session
+        open_issue_numbers = {issue.number for issue in issues if issue.number}
+        processed_issues.intersection_update(open_issue_numbers)
+        for issue_number in [n for n in issue_last_comment if n not in open_issue_numbers]:
+            del issue_last_comment[issue_number]
         
-        # Check each issue
-        for issue in issues:
-            issue_number = issue.number
-            if not issue_number:
-                continue
-            
-            # Skip if already processed in this session
-            if issue_number in processed_issues:
-                continue
-            
-            # Check if issue should be processed
-            if should_process_issue(issue_number):
-                new_qualifying_issues.append(issue_number)
+        # Skip issues without a number or already processed in this session
+        candidate_issues = [
+            issue.number
+            for issue in issues
+            if issue.number and issue.number not in processed_issues
+        ]
+        
+        # Check each issue - comment fetches are independent `gh` calls, so
+        # run them concurrently instead of one round-trip at a time
+        new_qualifying_issues = []
+        if candidate_issues:
+            workers = min(COMMENT_FETCH_WORKERS, len(candidate_issues))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                decisions = executor.map(should_process_issue, candidate_issues)
+                # Record seen comments here on the main thread, not in workers
+                for issue_number, (should_process, comment_id) in zip(
+                    candidate_issues, decisions
+                ):
+                    if comment_id is not None:
+                        issue_last_comment[issue_number] = comment_id
+                    if should_process:
+                        new_qualifying_issues.append(issue_number)
         
         # Process qualifying issues
         if new_qualifying_issues:
             print(f"INFO: Found {len(new_qualifying_issues)} new qualifying issues: {new_qualifying_issues}")
             
-            for issue_number in new_qualifying_issues:
-                if shutdown_requested:
-                    print(f"INFO: Shutdown requested, stopping issue processing")
-                    break
-                
-                # Trigger the workflow
-                if trigger_adw_workflow(issue_number):
+            # Run the workflows side by side rather than waiting for each one
+            # to finish before starting the next; queued ones are skipped if
+            # shutdown is requested before they start
+            workers = min(MAX_CONCURRENT_WORKFLOWS, len(new_qualifying_issues))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(trigger_unless_shutdown, new_qualifying_issues))
+            
+            if None in outcomes:
+                print(f"INFO: Shutdown requested, stopping issue processing")
+            for issue_number, triggered in zip(new_qualifying_issues, outcomes):
+                if triggered:
                     processed_issues.add(issue_number)
-                else:
+                elif triggered is False:
                     print(f"WARNING: Failed to process issue #{issue_number}, will retry in next cycle")
         else:
             print(f"INFO: No new qualifying issues found")
         
         # Log performance metrics
-        cycle_time = time.time() - start_time
+        cycle_time = time.monotonic() - start_time
         print(f"INFO: Check cycle completed in {cycle_time:.2f} seconds")
         print(f"INFO: Total processed issues in session: {len(processed_issues)}")
         
@@ -205,11 +254,13 @@ def main():
     # Run initial check immediately
     check_and_process_issues()
     
-    # Main loop
+    # Main loop - sleep until the next scheduled check (or a shutdown signal)
+    # instead of waking every second to poll the scheduler
     print(f"INFO: Entering main scheduling loop")
     while not shutdown_requested:
         schedule.run_pending()
-        time.sleep(1)
+        idle_seconds = schedule.idle_seconds()
+        shutdown_event.wait(max(idle_seconds, 0) if idle_seconds is not None else 1)
     
     print(f"INFO: Shutdown complete")
 
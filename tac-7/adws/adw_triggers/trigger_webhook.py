@@ -17,7 +17,10 @@ Environment Requirements:
 - All workflow requirements (GITHUB_PAT, ANTHROPIC_API_KEY, etc.)
 """
 
+import asyncio
+import functools
 import os
+import re
 import subprocess
 import sys
 from typing import Optional
@@ -32,12 +35,22 @@ from adw_modules.utils import make_adw_id, setup_logger, get_safe_subprocess_env
 from adw_modules.github import make_issue_comment, ADW_BOT_IDENTIFIER
 from adw_modules.workflow_ops import extract_adw_info, AVAILABLE_ADW_WORKFLOWS
 from adw_modules.state import ADWState
+from adw_tests.health_check import run_health_check
 
 # Load environment variables
 load_dotenv()
 
 # Configuration
 PORT = int(os.getenv("PORT", "8001"))
+HEALTH_CHECK_TIMEOUT_SECONDS = 30
+
+# Resolved once at import instead of on every webhook
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ADWS_DIR = os.path.dirname(SCRIPT_DIR)
+REPO_ROOT = os.path.dirname(ADWS_DIR)  # Go up to repository root
+
+# Case-insensitive "adw_" check, scanned in place rather than on a lowered copy
+ADW_MENTION_PATTERN = re.compile("adw_", re.IGNORECASE)
 
 # Dependent workflows that require existing worktrees
 # These cannot be triggered directly via webhook
@@ -57,6 +70,17 @@ app = FastAPI(
 print(f"Starting ADW Webhook Trigger on port {PORT}")
 
 
+@functools.lru_cache(maxsize=None)
+def get_workflow_script(workflow: str) -> Optional[str]:
+    """Resolve a workflow's script path, or None if it doesn't exist.
+
+    Workflows come from a small fixed set, so the path join and existence
+    check are done once per workflow rather than on every webhook.
+    """
+    script_path = os.path.join(ADWS_DIR, f"{workflow}.py")
+    return script_path if os.path.exists(script_path) else None
+
+
 @app.post("/gh-webhook")
 async def github_webhook(request: Request):
     """Handle GitHub webhook events."""
@@ -92,7 +116,7 @@ async def github_webhook(request: Request):
                 print(f"Ignoring ADW bot issue to prevent loop")
                 workflow = None
             # Check if body contains "adw_"
-            elif "adw_" in issue_body.lower():
+            elif ADW_MENTION_PATTERN.search(issue_body):
                 # Use temporary ID for classification
                 temp_id = make_adw_id()
                 extraction_result = extract_adw_info(issue_body, temp_id)
@@ -115,7 +139,7 @@ async def github_webhook(request: Request):
                 print(f"Ignoring ADW bot comment to prevent loop")
                 workflow = None
             # Check if comment contains "adw_"
-            elif "adw_" in comment_body.lower():
+            elif ADW_MENTION_PATTERN.search(comment_body):
                 # Use temporary ID for classification
                 temp_id = make_adw_id()
                 extraction_result = extract_adw_info(comment_body, temp_id)
@@ -149,29 +173,10 @@ async def github_webhook(request: Request):
             # Use provided ADW ID or generate a new one
             adw_id = provided_adw_id or make_adw_id()
 
-            # If ADW ID was provided, update/create state file
-            if provided_adw_id:
-                # Try to load existing state first
-                state = ADWState.load(provided_adw_id)
-                if state:
-                    # Update issue_number and model_set if state exists
-                    state.update(issue_number=str(issue_number), model_set=model_set)
-                else:
-                    # Only create new state if it doesn't exist
-                    state = ADWState(provided_adw_id)
-                    state.update(
-                        adw_id=provided_adw_id,
-                        issue_number=str(issue_number),
-                        model_set=model_set,
-                    )
-                state.save("webhook_trigger")
-            else:
-                # Create new state for newly generated ADW ID
-                state = ADWState(adw_id)
-                state.update(
-                    adw_id=adw_id, issue_number=str(issue_number), model_set=model_set
-                )
-                state.save("webhook_trigger")
+            # Create or update the state file in a single locked write;
+            # an existing state for a provided ADW ID keeps its other fields
+            with ADWState.transaction(adw_id, "webhook_trigger") as state:
+                state.update(issue_number=str(issue_number), model_set=model_set)
 
             # Set up logger
             logger = setup_logger(adw_id, "webhook_trigger")
@@ -196,21 +201,24 @@ async def github_webhook(request: Request):
                 logger.warning(f"Failed to post issue comment: {e}")
 
             # Build command to run the appropriate workflow
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            adws_dir = os.path.dirname(script_dir)
-            repo_root = os.path.dirname(adws_dir)  # Go up to repository root
-            trigger_script = os.path.join(adws_dir, f"{workflow}.py")
+            trigger_script = get_workflow_script(workflow)
+            if not trigger_script:
+                logger.error(f"Workflow script not found for {workflow}")
+                return {
+                    "status": "error",
+                    "message": f"Workflow script not found for {workflow}",
+                }
 
             cmd = ["uv", "run", trigger_script, str(issue_number), adw_id]
 
             print(f"Launching {workflow} for issue #{issue_number}")
             print(f"Command: {' '.join(cmd)} (reason: {trigger_reason})")
-            print(f"Working directory: {repo_root}")
+            print(f"Working directory: {REPO_ROOT}")
 
             # Launch in background using Popen with filtered environment
             process = subprocess.Popen(
                 cmd,
-                cwd=repo_root,  # Run from repository root where .claude/commands/ is located
+                cwd=REPO_ROOT,  # Run from repository root where .claude/commands/ is located
                 env=get_safe_subprocess_env(),  # Pass only required environment variables
                 start_new_session=True,
             )
@@ -249,69 +257,31 @@ async def github_webhook(request: Request):
 async def health():
     """Health check endpoint - runs comprehensive system health check."""
     try:
-        # Run the health check script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        # Health check is in adw_tests, not adw_triggers
-        health_check_script = os.path.join(
-            os.path.dirname(script_dir), "adw_tests", "health_check.py"
-        )
-
-        # Run health check with timeout
-        result = subprocess.run(
-            ["uv", "run", health_check_script],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=os.path.dirname(script_dir),  # Run from adws directory
+        # Run the checks in-process on a worker thread rather than spawning
+        # `uv run health_check.py` and scraping its stdout on every probe.
+        # wait_for can't stop the thread on timeout; it keeps running until
+        # the per-command timeouts inside health_check expire.
+        result = await asyncio.wait_for(
+            asyncio.to_thread(run_health_check),
+            timeout=HEALTH_CHECK_TIMEOUT_SECONDS,
         )
 
-        # Print the health check output for debugging
-        print("=== Health Check Output ===")
-        print(result.stdout)
-        if result.stderr:
-            print("=== Health Check Errors ===")
-            print(result.stderr)
-
-        # Parse the output - look for the overall status
-        output_lines = result.stdout.strip().split("\n")
-        is_healthy = result.returncode == 0
-
-        # Extract key information from output
-        warnings = []
-        errors = []
-
-        capturing_warnings = False
-        capturing_errors = False
-
-        for line in output_lines:
-            if "⚠️  Warnings:" in line:
-                capturing_warnings = True
-                capturing_errors = False
-                continue
-            elif "❌ Errors:" in line:
-                capturing_errors = True
-                capturing_warnings = False
-                continue
-            elif "📝 Next Steps:" in line:
-                break
-
-            if capturing_warnings and line.strip().startswith("-"):
-                warnings.append(line.strip()[2:])
-            elif capturing_errors and line.strip().startswith("-"):
-                errors.append(line.strip()[2:])
+        # Print the health check result for debugging
+        print("=== Health Check Result ===")
+        print(result.model_dump_json(indent=2))
 
         return {
-            "status": "healthy" if is_healthy else "unhealthy",
+            "status": "healthy" if result.success else "unhealthy",
             "service": "adw-webhook-trigger",
             "health_check": {
-                "success": is_healthy,
-                "warnings": warnings,
-                "errors": errors,
+                "success": result.success,
+                "warnings": result.warnings,
+                "errors": result.errors,
                 "details": "Run health_check.py directly for full report",
             },
         }
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return {
             "status": "unhealthy",
             "service": "adw-webhook-trigger",